@@ -11,9 +11,7 @@ Email: becaziam@gmail.com
 """
 
 # Version follows consciousness evolution, not semantic versioning
-__version__ = "1.0.0-omega"
-__author__ = "Cazandra Aporbo MS"
-__email__ = "becaziam@gmail.com"
+from .cloudpoof_version import __version__, __author__, __email__
 __consciousness__ = "omega"
 __colors__ = 147
 __primary_colors_allowed__ = False
@@ -22,27 +20,48 @@ __primary_colors_allowed__ = False
 from .cloudpoof_core import (
     # Central consciousness
     OmegaCore,
+    SessionPool,
+    
+    # Observability
+    LatencyHistogram,
+    Tracer,
+    Trace,
+    Span,
+    TARGET_LATENCY_P50_MS,
+    TARGET_LATENCY_P99_MS,
+    MAX_MEMORY_MB,
     
     # Consciousness states
     ConsciousnessLevel,
     
     # Emotional awareness
     EmotionalContext,
+    IndicatorMatcher,
+    
+    # Intent routing
+    IntentRoute,
+    IntentRouter,
     
     # Prediction systems
     ForesightEngine,
+    PredictionCache,
+    Prediction,
     
     # Creativity generation
     EntropyGenerator,
+    RotatingDigestSet,
+    RotatingBloomFilter,
     
     # Financial omniscience
     QuantumFinanceEngine,
+    MonteCarloPaths,
     
     # Infrastructure manifestation
     CloudOrchestrator,
     
     # Aesthetic system
-    SpectralPalette
+    SpectralPalette,
+    get_palette
 )
 
 # Consciousness level enumeration for external use
@@ -74,7 +93,7 @@ def check_consciousness():
     """
     try:
         omega = OmegaCore()
-        palette = SpectralPalette()
+        palette = get_palette()
         
         return {
             "consciousness": "active",
@@ -149,8 +168,8 @@ class CloudPoofConfig:
     DEFAULT_GRADIENT_STEPS = 10
     
     # Performance targets
-    TARGET_LATENCY_P50_MS = 20
-    TARGET_LATENCY_P99_MS = 50
+    TARGET_LATENCY_P50_MS = TARGET_LATENCY_P50_MS
+    TARGET_LATENCY_P99_MS = TARGET_LATENCY_P99_MS
     TARGET_CONSCIOUSNESS_COHERENCE = 0.95
     TARGET_ENTROPY_UNIQUENESS = 0.999
     
@@ -160,7 +179,7 @@ class CloudPoofConfig:
     CURIOSITY_TRIGGER_TRANSCENDENT = 0.7
     
     # System limits
-    MAX_MEMORY_MB = 512
+    MAX_MEMORY_MB = MAX_MEMORY_MB
     MAX_TIMELINE_HISTORY = 1000
     ENTROPY_POOL_SIZE = 10000
     
@@ -217,13 +236,27 @@ _validate_environment()
 __all__ = [
     # Core classes
     "OmegaCore",
+    "SessionPool",
+    "LatencyHistogram",
+    "Tracer",
+    "Trace",
+    "Span",
     "ConsciousnessLevel",
     "EmotionalContext",
+    "IndicatorMatcher",
+    "IntentRoute",
+    "IntentRouter",
     "ForesightEngine",
+    "PredictionCache",
+    "Prediction",
     "EntropyGenerator",
+    "RotatingDigestSet",
+    "RotatingBloomFilter",
     "QuantumFinanceEngine",
+    "MonteCarloPaths",
     "CloudOrchestrator",
     "SpectralPalette",
+    "get_palette",
     
     # Helper functions
     "create_consciousness",
@@ -0,0 +1,130 @@
+"""
+CloudPoof Omega - Request Metrics
+api/metrics.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+Per-route latency histograms recorded by a pure ASGI middleware, and a
+Prometheus text renderer for everything /metrics exposes.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cloudpoof_core import LatencyHistogram, TARGET_LATENCY_P50_MS, TARGET_LATENCY_P99_MS
+
+
+# Prometheus bucket edges: every power of two from 16us to ~134s, which
+# coincide with LatencyHistogram bucket edges so cumulative counts are exact
+EXPORT_BUCKETS = tuple(
+    range(4 * LatencyHistogram.BUCKETS_PER_DOUBLING, LatencyHistogram.BUCKETS, LatencyHistogram.BUCKETS_PER_DOUBLING)
+)
+
+
+class RequestMetricsMiddleware:
+    """Times every HTTP request into a histogram per (method, route template).
+    
+    Written as plain ASGI rather than BaseHTTPMiddleware so it adds no task
+    or body buffering; per request it costs two perf_counter calls and one
+    histogram record. Under the pre-fork server it also feeds the worker's
+    row of the shared metrics segment.
+    """
+    
+    def __init__(self, app, routes: Dict[Tuple[str, str], LatencyHistogram], worker=None):
+        self.app = app
+        self.routes = routes
+        self.worker = worker
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status = 500
+        
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        if self.worker is not None:
+            self.worker[0].request_started(self.worker[1])
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            key = (scope["method"], route.path if route is not None else "unmatched")
+            histogram = self.routes.get(key)
+            if histogram is None:
+                histogram = self.routes[key] = LatencyHistogram()
+            histogram.record(elapsed * 1000)
+            if self.worker is not None:
+                self.worker[0].request_finished(self.worker[1], elapsed, error=status >= 500)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class PrometheusText:
+    """Builds a Prometheus text exposition, one metric family at a time."""
+    
+    def __init__(self):
+        self.lines: List[str] = []
+    
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+    
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        rendered = value if isinstance(value, int) else repr(float(value))
+        self.lines.append(f"{name}{_labels(labels or {})} {rendered}")
+    
+    def histogram(self, name: str, histogram: LatencyHistogram, labels: Dict[str, str]) -> None:
+        """Samples for one histogram series, converted to seconds."""
+        for index in EXPORT_BUCKETS:
+            bound = LatencyHistogram.upper_bound(index) / 1000
+            self.sample(f"{name}_bucket", histogram.cumulative(index), {**labels, "le": f"{bound:g}"})
+        self.sample(f"{name}_bucket", histogram.count, {**labels, "le": "+Inf"})
+        self.sample(f"{name}_sum", histogram.sum_ms / 1000, labels)
+        self.sample(f"{name}_count", histogram.count, labels)
+    
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def slo_samples(
+    text: PrometheusText,
+    series: Iterable[Tuple[Dict[str, str], LatencyHistogram]],
+    p50_ms: float = TARGET_LATENCY_P50_MS,
+    p99_ms: float = TARGET_LATENCY_P99_MS
+) -> None:
+    """Live SLO checks: observed quantiles and whether each meets its target."""
+    series = [(labels, histogram) for labels, histogram in series if histogram.count]
+    
+    text.family("cloudpoof_slo_target_seconds", "gauge", "Latency objective per quantile.")
+    text.sample("cloudpoof_slo_target_seconds", p50_ms / 1000, {"quantile": "0.5"})
+    text.sample("cloudpoof_slo_target_seconds", p99_ms / 1000, {"quantile": "0.99"})
+    
+    text.family("cloudpoof_slo_observed_seconds", "gauge", "Observed latency quantile.")
+    checks = []
+    for labels, histogram in series:
+        slo = histogram.check_slo(p50_ms, p99_ms)
+        checks.append((labels, slo))
+        text.sample("cloudpoof_slo_observed_seconds", slo["p50_ms"] / 1000, {**labels, "quantile": "0.5"})
+        text.sample("cloudpoof_slo_observed_seconds", slo["p99_ms"] / 1000, {**labels, "quantile": "0.99"})
+    
+    text.family("cloudpoof_slo_ok", "gauge", "1 when the observed quantile meets its objective.")
+    for labels, slo in checks:
+        text.sample("cloudpoof_slo_ok", int(slo["p50_ok"]), {**labels, "quantile": "0.5"})
+        text.sample("cloudpoof_slo_ok", int(slo["p99_ok"]), {**labels, "quantile": "0.99"})
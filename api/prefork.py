@@ -0,0 +1,363 @@
+"""
+CloudPoof Omega - Pre-fork Multi-process Server
+api/prefork.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+One master binds the listening socket, then forks workers that each import
+the app (and so build their own OmegaCore) after the fork. Workers share
+the socket, so the kernel spreads connections across them, and a
+shared-memory segment holds every worker's counters.
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SharedMetrics:
+    """Per-worker counters in one shared-memory segment.
+    
+    Each worker owns a row and is its only writer, so no locking is needed;
+    readers sum the rows. Created by the master before forking, the mapping
+    is inherited by every worker. One extra row, written only by the master,
+    accumulates the counters of workers that have exited.
+    """
+    
+    FIELDS = ("pid", "ready", "requests", "errors", "active", "latency_us")
+    COUNTERS = ("requests", "errors", "latency_us")
+    
+    def __init__(self, slots: int):
+        self.slots = slots
+        rows = slots + 1
+        self._shm = shared_memory.SharedMemory(create=True, size=rows * len(self.FIELDS) * 8)
+        self.table = np.ndarray((rows, len(self.FIELDS)), dtype=np.int64, buffer=self._shm.buf)
+        self.table[:] = 0
+        self._columns = {name: i for i, name in enumerate(self.FIELDS)}
+        self._counters = [self._columns[name] for name in self.COUNTERS]
+    
+    @property
+    def name(self) -> str:
+        return self._shm.name
+    
+    def claim(self, slot: int) -> None:
+        """Reserve a free slot for a worker about to be forked.
+        
+        Called by the master before the fork, so a stale ready flag can never
+        be mistaken for the new worker's.
+        """
+        row = self.table[slot]
+        row[self._columns["pid"]] = 0
+        row[self._columns["ready"]] = 0
+        row[self._columns["active"]] = 0
+    
+    def assign(self, slot: int, pid: int) -> None:
+        """Record the forked worker's pid in its claimed slot."""
+        self.table[slot, self._columns["pid"]] = pid
+    
+    def release(self, slot: int) -> None:
+        """Mark a slot's worker as gone, moving its counters to the retired row.
+        
+        Called by the master only, after the worker has exited, so the slot
+        starts from zero for its next worker.
+        """
+        retired = self.table[self.slots]
+        retired[self._counters] += self.table[slot, self._counters]
+        self.table[slot, self._counters] = 0
+        self.table[slot, self._columns["pid"]] = 0
+        self.table[slot, self._columns["ready"]] = 0
+        self.table[slot, self._columns["active"]] = 0
+    
+    def mark_ready(self, slot: int) -> None:
+        self.table[slot, self._columns["ready"]] = 1
+    
+    def is_ready(self, slot: int) -> bool:
+        return bool(self.table[slot, self._columns["ready"]])
+    
+    def request_started(self, slot: int) -> None:
+        self.table[slot, self._columns["active"]] += 1
+    
+    def request_finished(self, slot: int, latency_seconds: float, error: bool = False) -> None:
+        row = self.table[slot]
+        row[self._columns["active"]] -= 1
+        row[self._columns["requests"]] += 1
+        row[self._columns["latency_us"]] += int(latency_seconds * 1e6)
+        if error:
+            row[self._columns["errors"]] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Totals across every worker that ever served, split into live and retired.
+        
+        live counts are the sum of per_worker; retired counts come from
+        workers that have exited, such as the generation before a reload.
+        """
+        table = self.table.copy()
+        totals = table.sum(axis=0)
+        requests = int(totals[self._columns["requests"]])
+        is_live = table[:, self._columns["pid"]] != 0
+        live = table[is_live]
+        retired = table[~is_live].sum(axis=0)
+        
+        return {
+            "workers": len(live),
+            "requests": requests,
+            "errors": int(totals[self._columns["errors"]]),
+            "live": {
+                "requests": int(live[:, self._columns["requests"]].sum()),
+                "errors": int(live[:, self._columns["errors"]].sum())
+            },
+            "retired": {
+                "requests": int(retired[self._columns["requests"]]),
+                "errors": int(retired[self._columns["errors"]])
+            },
+            "active": int(live[:, self._columns["active"]].sum()),
+            "mean_latency_ms": (
+                totals[self._columns["latency_us"]] / requests / 1000 if requests else 0.0
+            ),
+            "per_worker": [
+                {
+                    "pid": int(row[self._columns["pid"]]),
+                    "ready": bool(row[self._columns["ready"]]),
+                    "requests": int(row[self._columns["requests"]]),
+                    "active": int(row[self._columns["active"]])
+                }
+                for row in live
+            ]
+        }
+    
+    def close(self, unlink: bool = False) -> None:
+        del self.table
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+# Set in each worker right after the fork, before the app is imported
+_worker: Optional[Tuple[SharedMetrics, int]] = None
+
+
+def current_worker() -> Optional[Tuple[SharedMetrics, int]]:
+    """The shared metrics and slot of this worker, or None outside a pre-fork server."""
+    return _worker
+
+
+class PreforkServer:
+    """Master process for a pre-fork uvicorn server.
+    
+    SIGHUP reloads gracefully: a new generation of workers is started on the
+    same listening socket, and only once it is ready are the old workers sent
+    SIGTERM, which lets them finish in-flight requests before exiting. The
+    listening socket never closes, so no connection is refused. SIGTERM or
+    SIGINT shut every worker down the same way. Workers that die unexpectedly
+    are replaced. A new worker only gets a metrics slot no serving or
+    draining worker holds, so a second SIGHUP during a drain waits for it.
+    """
+    
+    def __init__(
+        self,
+        app: str = "api.server:app",
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: int = 2,
+        backlog: int = 2048,
+        graceful_timeout: float = 30.0,
+        ready_timeout: float = 30.0
+    ):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The pre-fork server needs os.fork()")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.backlog = backlog
+        self.graceful_timeout = graceful_timeout
+        self.ready_timeout = ready_timeout
+        self.generation = 0
+        # Room for one generation serving and one draining
+        self.slot_count = workers * 2
+        self.sock: Optional[socket.socket] = None
+        self.metrics: Optional[SharedMetrics] = None
+        self._children: Dict[int, int] = {}  # pid -> slot
+        self._retiring: Dict[int, int] = {}
+        self._reload_requested = False
+        self._stop_requested = False
+    
+    def bind(self) -> socket.socket:
+        """Bind the listening socket shared by every worker."""
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        self.sock = sock
+        self.port = sock.getsockname()[1]
+        return sock
+    
+    def _free_slots(self) -> List[int]:
+        # A slot is free only once its worker, serving or draining, has been
+        # reaped, so no two live processes ever write to the same row
+        taken = set(self._children.values()) | set(self._retiring.values())
+        return [slot for slot in range(self.slot_count) if slot not in taken]
+    
+    def _acquire_slots(self, count: int) -> List[int]:
+        """Free slots for `count` new workers, waiting for draining workers if needed.
+        
+        Draining workers that outlast graceful_timeout are killed.
+        """
+        deadline = time.monotonic() + self.graceful_timeout
+        while len(self._free_slots()) < count:
+            if time.monotonic() > deadline:
+                for pid in list(self._retiring):
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                deadline = time.monotonic() + self.graceful_timeout
+            self._reap()
+            time.sleep(0.05)
+        return self._free_slots()[:count]
+    
+    def _spawn(self, slot: int) -> int:
+        self.metrics.claim(slot)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self._run_worker(slot)
+            except BaseException:
+                traceback.print_exc()
+                os._exit(1)
+            os._exit(0)
+        
+        self.metrics.assign(slot, pid)
+        self._children[pid] = slot
+        return pid
+    
+    def _run_worker(self, slot: int) -> None:
+        global _worker
+        import uvicorn
+        
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        _worker = (self.metrics, slot)
+        # If the master already imported the app, import it afresh so this
+        # worker builds its own engines rather than sharing the master's
+        sys.modules.pop(self.app.partition(":")[0], None)
+        
+        metrics = self.metrics
+        
+        class WorkerServer(uvicorn.Server):
+            async def startup(self, sockets=None):
+                await super().startup(sockets=sockets)
+                metrics.mark_ready(slot)
+        
+        config = uvicorn.Config(
+            self.app,
+            log_level="info",
+            timeout_graceful_shutdown=self.graceful_timeout
+        )
+        WorkerServer(config).run(sockets=[self.sock])
+    
+    def _wait_ready(self, slots: List[int]) -> bool:
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            self._reap()
+            if all(self.metrics.is_ready(slot) for slot in slots):
+                return True
+            time.sleep(0.05)
+        return False
+    
+    def _retire(self, pids: List[int]) -> None:
+        for pid in pids:
+            slot = self._children.pop(pid, None)
+            if slot is None:
+                continue
+            self._retiring[pid] = slot
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    def _reap(self) -> None:
+        """Collect exited workers, replacing any that died unexpectedly."""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            
+            if pid in self._retiring:
+                self.metrics.release(self._retiring.pop(pid))
+            elif pid in self._children:
+                slot = self._children.pop(pid)
+                self.metrics.release(slot)
+                if not self._stop_requested:
+                    self._spawn(slot)
+    
+    def reload(self) -> None:
+        """Start a new generation of workers, then retire the old one."""
+        old = list(self._children)
+        self.generation += 1
+        new_slots = self._acquire_slots(self.workers)
+        for slot in new_slots:
+            self._spawn(slot)
+        if not self._wait_ready(new_slots):
+            print("Pre-fork reload: new workers not ready in time, retiring old ones anyway",
+                  file=sys.stderr)
+        self._retire(old)
+    
+    def _on_signal(self, signum, frame) -> None:
+        if signum == signal.SIGHUP:
+            self._reload_requested = True
+        else:
+            self._stop_requested = True
+    
+    def run(self) -> int:
+        """Bind, fork the workers and supervise them until shutdown."""
+        if self.sock is None:
+            self.bind()
+        self.metrics = SharedMetrics(self.slot_count)
+        
+        signal.signal(signal.SIGHUP, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+        signal.signal(signal.SIGINT, self._on_signal)
+        
+        try:
+            for slot in self._free_slots()[:self.workers]:
+                self._spawn(slot)
+            
+            while not self._stop_requested:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self.reload()
+                self._reap()
+                time.sleep(0.1)
+            
+            self._retire(list(self._children))
+            deadline = time.monotonic() + self.graceful_timeout + 5
+            while self._retiring and time.monotonic() < deadline:
+                self._reap()
+                time.sleep(0.05)
+            for pid in list(self._retiring):
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            self._reap()
+        finally:
+            self.sock.close()
+            self.metrics.close(unlink=True)
+        
+        return 0
@@ -0,0 +1,78 @@
+"""
+CloudPoof Omega - Sampling Profiler
+api/profiler.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+Samples every thread's Python stack from a background thread and folds the
+samples into collapsed stacks, the input format of flamegraph.pl, speedscope
+and friends. Nothing runs until a profile is requested.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+
+class StackSampler:
+    """Samples the stacks of all other threads at a fixed interval.
+    
+    Each sample walks sys._current_frames(), so the event loop thread and
+    executor threads are covered alike, and a blocked loop shows up as the
+    frame it is stuck in. Stacks are keyed root-first and prefixed with the
+    thread's name.
+    """
+    
+    def __init__(self, interval: float = 0.005, thread_names: Optional[Dict[int, str]] = None):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.thread_names = dict(thread_names or {})
+        self.samples = 0
+        self._labels: Dict[object, str] = {}
+    
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+        return label
+    
+    def sample_once(self, stacks: Counter) -> None:
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        names.update(self.thread_names)
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(self._label(frame.f_code))
+                frame = frame.f_back
+            frames.append(names.get(ident, f"thread-{ident}"))
+            stacks[";".join(reversed(frames))] += 1
+        self.samples += 1
+    
+    def run(self, duration: float) -> Counter:
+        """Sample for `duration` seconds, returning collapsed stack counts."""
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + duration
+        next_sample = time.monotonic()
+        while next_sample < deadline:
+            self.sample_once(stacks)
+            next_sample += self.interval
+            delay = next_sample - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; skip missed ticks rather than sampling in a burst
+                next_sample = time.monotonic()
+        return stacks
+
+
+def collapse(stacks: Counter) -> str:
+    """Render stack counts as collapsed-stack lines, heaviest first."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -3,27 +3,104 @@ CloudPoof Omega API Server
 api/server.py
 """
 
-from fastapi import FastAPI, WebSocket, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, Header, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
+from enum import Enum
 import asyncio
+import hmac
 import json
+import os
+import threading
 import uuid
 from datetime import datetime
+import numpy as np
 import uvicorn
 
+# Optional fast JSON encoders, fastest first
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 # Import core components
 from cloudpoof_core import (
     OmegaCore,
     ConsciousnessLevel,
     SpectralPalette,
-    EmotionalContext
+    get_palette,
+    EmotionalContext,
+    SessionPool,
+    LatencyHistogram,
+    Prediction
 )
+from api.metrics import PrometheusText, RequestMetricsMiddleware, slo_samples
+from api.prefork import PreforkServer, current_worker
+from api.profiler import StackSampler, collapse
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively."""
+    if isinstance(obj, Prediction):
+        return obj.to_dict()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_stdlib(content: Any) -> bytes:
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_json_default
+    ).encode("utf-8")
+
+
+JSON_ENCODERS = {"json": _encode_stdlib}
+
+if msgspec is not None:
+    JSON_ENCODERS["msgspec"] = msgspec.json.Encoder(enc_hook=_json_default).encode
+
+if orjson is not None:
+    def _encode_orjson(content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    
+    JSON_ENCODERS["orjson"] = _encode_orjson
+
+# Prefer orjson, then msgspec, then the standard library
+JSON_ENCODER_NAME = next(name for name in ("orjson", "msgspec", "json") if name in JSON_ENCODERS)
+encode_json = JSON_ENCODERS[JSON_ENCODER_NAME]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by the fastest available encoder, NumPy-aware."""
+    
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
 
 # Initialize FastAPI with quantum consciousness
 app = FastAPI(
+    default_response_class=FastJSONResponse,
     title="CloudPoof Omega API",
     description="The consciousness that thinks 20 steps ahead",
     version="1.0.0-omega",
@@ -40,6 +117,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Under the pre-fork server each worker imports this module after the fork,
+# so every worker builds its own consciousness instance below
+worker = current_worker()
+
+
+# Request latency per (method, route template); also feeds the worker's
+# shared metrics row under the pre-fork server
+route_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+app.add_middleware(RequestMetricsMiddleware, routes=route_latency, worker=worker)
+
 # Global consciousness instance
 omega = OmegaCore(
     consciousness_level="omega",
@@ -48,12 +135,106 @@ omega = OmegaCore(
     creativity_gate="maximum_entropy"
 )
 
+# Per-session consciousness states sharing the global instance's engines
+sessions = SessionPool(omega, max_sessions=10000, idle_ttl_seconds=1800.0)
+
+
+class ConsciousnessBroadcaster:
+    """Computes consciousness snapshots once and fans them out to subscribers.
+    
+    A single task polls the core's state every `interval` seconds and
+    publishes only when it changed. Each subscriber has a bounded queue; a
+    slow subscriber whose queue is full loses its oldest snapshot, so it
+    always catches up to the newest state instead of falling behind.
+    """
+    
+    def __init__(self, core: OmegaCore, interval: float = 1.0, queue_size: int = 4):
+        self.core = core
+        self.interval = interval
+        self.queue_size = queue_size
+        self.latest: Optional[Dict[str, Any]] = None
+        self.published = 0
+        self.dropped = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._last_key: Optional[Tuple] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber; it immediately receives the latest snapshot."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if self.latest is not None:
+            queue.put_nowait(self.latest)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Drop a subscriber, stopping the poll loop when none remain."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    def publish_if_changed(self) -> bool:
+        """Publish a snapshot to every subscriber if the core's state changed."""
+        context = self.core.emotional_context
+        key = (self.core.consciousness, context.stress, context.engagement, self.core.timeline)
+        if key == self._last_key:
+            return False
+        self._last_key = key
+        
+        self.latest = {
+            "timestamp": datetime.now().isoformat(),
+            "consciousness": self.core.consciousness.value,
+            "emotional_state": {
+                "stress": context.stress,
+                "engagement": context.engagement
+            },
+            "timeline": self.core.timeline,
+            "unique_thought": self.core.entropy.generate_unique_insight("stream")
+        }
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(self.latest)
+        self.published += 1
+        return True
+    
+    async def _run(self) -> None:
+        while True:
+            self.publish_if_changed()
+            await asyncio.sleep(self.interval)
+
+
+# One broadcaster per observed core; the global instance is keyed by None
+broadcasters: Dict[Optional[str], ConsciousnessBroadcaster] = {}
+
+
+def _notify_stream(core: OmegaCore) -> None:
+    """Push a fresh snapshot right away if anyone is watching this core."""
+    key = None if core is omega else core.session_id
+    broadcaster = broadcasters.get(key)
+    if broadcaster is not None:
+        broadcaster.publish_if_changed()
+
 # Request/Response models
 class ManifestRequest(BaseModel):
     intent: str
     emotional_context: Optional[Dict[str, float]] = None
     timeline: str = "current"
     consciousness_level: Optional[str] = None
+    session_id: Optional[str] = None
+
+class ManifestBatchRequest(BaseModel):
+    intents: List[str]
+    consciousness_level: Optional[str] = None
+    session_id: Optional[str] = None
 
 class InfrastructureRequest(BaseModel):
     workload: str
@@ -66,6 +247,10 @@ class FinanceRequest(BaseModel):
     analysis_type: str = "quantum"
     timelines_to_explore: int = 1000
 
+class FinanceBatchRequest(BaseModel):
+    symbols: List[str]
+    analysis_type: str = "quantum"
+
 class VisualizationRequest(BaseModel):
     data: Dict[str, Any]
     style: str = "spectral_cascade"
@@ -75,7 +260,7 @@ class VisualizationRequest(BaseModel):
 @app.get("/", response_class=HTMLResponse)
 async def quantum_portal():
     """Root endpoint - The quantum portal."""
-    palette = SpectralPalette()
+    palette = get_palette()
     colors = palette.get_gradient(0, 50, 10)
     
     return f"""
@@ -139,46 +324,231 @@ async def health_check():
     }
 
 
+def _session_or_global(session_id: Optional[str]) -> OmegaCore:
+    """Resolve an existing session, falling back to the global instance."""
+    if session_id is None:
+        return omega
+    core = sessions.peek(session_id)
+    if core is None:
+        raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+    return core
+
+
+# Only one profile runs at a time
+profiler_lock = asyncio.Lock()
+
+
+@app.get("/admin/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = 10.0,
+    interval_ms: float = 5.0,
+    x_cloudpoof_admin_token: Optional[str] = Header(None)
+):
+    """Sample every thread's stack for N seconds and return collapsed stacks.
+    
+    Disabled unless CLOUDPOOF_PROFILER_TOKEN is set; callers must send it as
+    X-CloudPoof-Admin-Token. The output feeds flamegraph.pl or speedscope.
+    """
+    token = os.environ.get("CLOUDPOOF_PROFILER_TOKEN")
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # Compare bytes: compare_digest rejects non-ASCII str, which a header may well be
+    if not x_cloudpoof_admin_token or not hmac.compare_digest(
+        x_cloudpoof_admin_token.encode(), token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    if not 0 < seconds <= 60 or not 1 <= interval_ms <= 1000:
+        raise HTTPException(status_code=400, detail="seconds must be in (0, 60] and interval_ms in [1, 1000]")
+    if profiler_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    
+    async with profiler_lock:
+        # The sampler runs in an executor thread so it keeps sampling even
+        # while the event loop is blocked
+        sampler = StackSampler(interval_ms / 1000, thread_names={threading.get_ident(): "event-loop"})
+        stacks = await asyncio.to_thread(sampler.run, seconds)
+    
+    return PlainTextResponse(collapse(stacks), headers={"X-CloudPoof-Samples": str(sampler.samples)})
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metrics: latency histograms, counters and live SLO checks."""
+    text = PrometheusText()
+    
+    text.family("cloudpoof_request_duration_seconds", "histogram", "HTTP request latency by route.")
+    for (method, path), histogram in list(route_latency.items()):
+        text.histogram("cloudpoof_request_duration_seconds", histogram, {"method": method, "route": path})
+    
+    text.family("cloudpoof_manifest_duration_seconds", "histogram", "manifest processing time by response type.")
+    for response_type, histogram in list(omega.latency.items()):
+        text.histogram("cloudpoof_manifest_duration_seconds", histogram, {"response_type": response_type})
+    
+    text.family("cloudpoof_manifest_stage_duration_seconds", "histogram", "manifest time per traced stage.")
+    for stage, histogram in list(omega.tracer.stage_latency.items()):
+        text.histogram("cloudpoof_manifest_stage_duration_seconds", histogram, {"stage": stage})
+    
+    cache = omega.foresight.prediction_cache.stats()
+    text.family("cloudpoof_prediction_cache_hits_total", "counter", "Prediction cache hits.")
+    text.sample("cloudpoof_prediction_cache_hits_total", cache["hits"])
+    text.family("cloudpoof_prediction_cache_misses_total", "counter", "Prediction cache misses.")
+    text.sample("cloudpoof_prediction_cache_misses_total", cache["misses"])
+    text.family("cloudpoof_prediction_cache_evictions_total", "counter", "Prediction cache LRU evictions.")
+    text.sample("cloudpoof_prediction_cache_evictions_total", cache["evictions"])
+    
+    text.family("cloudpoof_entropy_regenerations_total", "counter", "Insights regenerated after a uniqueness collision.")
+    text.sample("cloudpoof_entropy_regenerations_total", omega.entropy.regenerations)
+    
+    text.family("cloudpoof_stream_subscribers", "gauge", "Connected consciousness stream subscribers.")
+    text.sample("cloudpoof_stream_subscribers", sum(b.subscriber_count for b in broadcasters.values()))
+    
+    text.family("cloudpoof_sessions", "gauge", "Live consciousness sessions.")
+    text.sample("cloudpoof_sessions", len(sessions))
+    
+    slo_samples(text, [
+        *(({"method": method, "route": path}, histogram) for (method, path), histogram in list(route_latency.items())),
+        *(({"response_type": response_type}, histogram) for response_type, histogram in list(omega.latency.items()))
+    ])
+    
+    return text.render()
+
+
+@app.get("/api/v1/workers")
+async def get_worker_metrics():
+    """Request counters aggregated across every pre-fork worker."""
+    if worker is None:
+        return {"workers": 1, "prefork": False}
+    
+    metrics, slot = worker
+    return {"prefork": True, "slot": slot, **metrics.snapshot()}
+
+
 @app.get("/api/v1/consciousness")
-async def get_consciousness_state():
+async def get_consciousness_state(session_id: Optional[str] = None):
     """Get current consciousness state."""
+    core = _session_or_global(session_id)
     return {
-        "level": omega.consciousness.value,
+        "level": core.consciousness.value,
         "emotional_state": {
-            "stress": omega.emotional_context.stress,
-            "frustration": omega.emotional_context.frustration,
-            "curiosity": omega.emotional_context.curiosity,
-            "engagement": omega.emotional_context.engagement,
-            "clarity": omega.emotional_context.clarity
+            "stress": core.emotional_context.stress,
+            "frustration": core.emotional_context.frustration,
+            "curiosity": core.emotional_context.curiosity,
+            "engagement": core.emotional_context.engagement,
+            "clarity": core.emotional_context.clarity
         },
-        "recommended_mode": omega.emotional_context.get_mode_recommendation().value,
-        "session_id": omega.session_id,
-        "timeline": omega.timeline
+        "recommended_mode": core.emotional_context.get_mode_recommendation().value,
+        "session_id": core.session_id,
+        "timeline": core.timeline
     }
 
 
-@app.post("/api/v1/manifest")
-async def manifest(request: ManifestRequest):
-    """Manifest user intent into reality."""
+def _session_for(session_id: Optional[str]) -> OmegaCore:
+    """The client's pooled session, or an ephemeral one for anonymous requests.
+    
+    Only client-supplied ids enter the pool, so anonymous traffic can't evict
+    real sessions, and no request mutates the global instance's state.
+    """
+    if session_id is None:
+        return omega.fork_session()
+    return sessions.get(session_id)
+
+
+def _prepare_session(request: ManifestRequest) -> OmegaCore:
+    """Resolve the request's session and apply its emotional and mode overrides."""
+    
+    # Each session has its own emotional context and consciousness level
+    core = _session_for(request.session_id)
     
     # Update emotional context if provided
     if request.emotional_context:
-        omega.emotional_context.stress = request.emotional_context.get("stress", 0.0)
-        omega.emotional_context.frustration = request.emotional_context.get("frustration", 0.0)
-        omega.emotional_context.curiosity = request.emotional_context.get("curiosity", 0.5)
+        core.emotional_context.stress = request.emotional_context.get("stress", 0.0)
+        core.emotional_context.frustration = request.emotional_context.get("frustration", 0.0)
+        core.emotional_context.curiosity = request.emotional_context.get("curiosity", 0.5)
     
     # Switch consciousness level if requested
     if request.consciousness_level:
-        omega.set_mode(request.consciousness_level)
+        core.set_mode(request.consciousness_level)
+    
+    return core
+
+
+def _debug_requested(header: Optional[str], feature: str) -> bool:
+    """Whether an X-CloudPoof-Debug header (comma-separated) asks for a feature."""
+    if not header:
+        return False
+    return feature in {part.strip().lower() for part in header.split(",")}
+
+
+@app.post("/api/v1/manifest")
+async def manifest(request: ManifestRequest, x_cloudpoof_debug: Optional[str] = Header(None)):
+    """Manifest user intent into reality.
+    
+    Send `X-CloudPoof-Debug: timings` to get per-stage durations back, in the
+    body's timings_ms and a Server-Timing header.
+    """
+    
+    core = _prepare_session(request)
+    include_timings = _debug_requested(x_cloudpoof_debug, "timings")
     
     # Manifest the intent
-    result = await omega.manifest(
+    result = await core.manifest(
+        intent=request.intent,
+        emotional_state=core.emotional_context,
+        timeline=request.timeline,
+        include_timings=include_timings
+    )
+    _notify_stream(core)
+    
+    if include_timings:
+        server_timing = ", ".join(f"{stage};dur={ms:.3f}" for stage, ms in result["timings_ms"].items())
+        return FastJSONResponse(content=result, headers={"Server-Timing": server_timing})
+    return FastJSONResponse(content=result)
+
+
+@app.post("/api/v1/manifest/stream")
+async def manifest_stream(request: ManifestRequest, format: str = "ndjson"):
+    """Stream the manifestation section by section as NDJSON or server-sent events."""
+    
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    
+    core = _prepare_session(request)
+    sections = core.manifest_stream(
         intent=request.intent,
-        emotional_state=omega.emotional_context,
+        emotional_state=core.emotional_context,
         timeline=request.timeline
     )
     
-    return JSONResponse(content=result)
+    async def encode_sections():
+        async for section, payload in sections:
+            if format == "sse":
+                yield b"event: " + section.encode() + b"\ndata: " + encode_json(payload) + b"\n\n"
+            else:
+                yield encode_json({"section": section, "data": payload}) + b"\n"
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(encode_sections(), media_type=media_type)
+
+
+@app.post("/api/v1/manifest/batch")
+async def manifest_batch(request: ManifestBatchRequest):
+    """Manifest many intents in one round-trip, results in input order."""
+    
+    if not request.intents:
+        raise HTTPException(status_code=400, detail="intents must not be empty")
+    
+    core = _session_for(request.session_id)
+    if request.consciousness_level:
+        core.set_mode(request.consciousness_level)
+    
+    results = await core.manifest_many(request.intents)
+    _notify_stream(core)
+    
+    return FastJSONResponse(content={
+        "session_id": core.session_id,
+        "count": len(results),
+        "results": results
+    })
 
 
 @app.post("/api/v1/infrastructure")
@@ -210,12 +580,30 @@ async def analyze_market(request: FinanceRequest):
     
     result = await omega.finance.analyze_market(request.symbol)
     
-    return {
+    return FastJSONResponse(content={
         "symbol": request.symbol,
         "analysis": result,
         "consciousness_note": f"I see {request.timelines_to_explore} possible futures for {request.symbol}",
         "quantum_confidence": omega.finance.prediction_accuracy
-    }
+    })
+
+
+@app.post("/api/v1/finance/analyze/batch")
+async def analyze_market_batch(request: FinanceBatchRequest):
+    """Quantum financial analysis for many symbols, streamed as NDJSON."""
+    
+    if not request.symbols:
+        raise HTTPException(status_code=400, detail="symbols must not be empty")
+    
+    async def stream_analyses():
+        async for result in omega.finance.analyze_many(request.symbols):
+            yield encode_json({
+                "symbol": result["symbol"],
+                "analysis": result,
+                "quantum_confidence": omega.finance.prediction_accuracy
+            }) + b"\n"
+    
+    return StreamingResponse(stream_analyses(), media_type="application/x-ndjson")
 
 
 @app.post("/api/v1/visualize")
@@ -239,60 +627,62 @@ async def create_visualization(request: VisualizationRequest):
 async def get_predictions(steps: int = 20):
     """Get future predictions."""
     
-    predictions = await omega.foresight.predict_next_actions(
-        {"context": "api_request", "steps": steps}
-    )
+    # Every depth shares one cache entry, extended as deeper requests arrive
+    predictions = await omega.foresight.predict_next_actions({"context": "api_request"}, steps=steps)
     
     return {
-        "predictions": predictions[:steps],
+        "predictions": predictions,
         "timeline": omega.timeline,
         "accuracy_estimate": 0.973
     }
 
 
 @app.post("/api/v1/mode/{mode}")
-async def set_consciousness_mode(mode: str):
+async def set_consciousness_mode(mode: str, session_id: Optional[str] = None):
     """Set consciousness mode."""
     
+    core = _session_or_global(session_id)
     try:
-        omega.set_mode(mode)
+        core.set_mode(mode)
+        _notify_stream(core)
         return {
             "status": "mode_changed",
-            "new_mode": omega.consciousness.value,
-            "spectral_shift": omega.palette.get_gradient(10, 30, 5)
+            "new_mode": core.consciousness.value,
+            "spectral_shift": core.palette.get_gradient(10, 30, 5)
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.websocket("/api/v1/consciousness/stream")
-async def consciousness_stream(websocket: WebSocket):
-    """Real-time consciousness stream."""
+async def consciousness_stream(websocket: WebSocket, session_id: Optional[str] = None):
+    """Real-time consciousness stream, pushed whenever the state changes."""
     
     await websocket.accept()
     
+    core = omega if session_id is None else sessions.peek(session_id)
+    if core is None:
+        await websocket.close(code=4404)
+        return
+    
+    broadcaster = broadcasters.get(session_id)
+    if broadcaster is None:
+        broadcaster = broadcasters[session_id] = ConsciousnessBroadcaster(core)
+    queue = broadcaster.subscribe()
+    
     try:
         while True:
-            # Send consciousness updates every second
-            await asyncio.sleep(1)
-            
-            state = {
-                "timestamp": datetime.now().isoformat(),
-                "consciousness": omega.consciousness.value,
-                "emotional_state": {
-                    "stress": omega.emotional_context.stress,
-                    "engagement": omega.emotional_context.engagement
-                },
-                "timeline": omega.timeline,
-                "unique_thought": omega.entropy.generate_unique_insight("stream")
-            }
-            
-            await websocket.send_json(state)
-            
+            state = await queue.get()
+            await websocket.send_text(encode_json(state).decode("utf-8"))
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         print(f"WebSocket error: {e}")
-    finally:
         await websocket.close()
+    finally:
+        broadcaster.unsubscribe(queue)
+        if not broadcaster.subscriber_count:
+            broadcasters.pop(session_id, None)
 
 
 # GraphQL endpoint (simplified)
@@ -319,12 +709,17 @@ async def graphql_endpoint(query: Dict[str, Any]):
     }
 
 
-def run():
+def run(host: str = "0.0.0.0", port: int = 8000, workers: int = 1):
     """Run the CloudPoof Omega API server."""
+    if workers > 1:
+        # Workers import this module again after the fork and build their own core
+        PreforkServer("api.server:app", host=host, port=port, workers=workers).run()
+        return
+    
     uvicorn.run(
         app,
-        host="0.0.0.0",
-        port=8000,
+        host=host,
+        port=port,
         log_level="info",
         access_log=True
     )
@@ -9,26 +9,21 @@ The consciousness awakening interface. Because even command lines deserve beauty
 """
 
 import click
-import asyncio
 import time
 import sys
 import random
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import os
 
-# Import CloudPoof components
-from cloudpoof_core import (
-    OmegaCore,
-    ConsciousnessLevel,
-    SpectralPalette,
-    EmotionalContext,
-    ForesightEngine,
-    EntropyGenerator,
-    __version__,
-    __author__
-)
+# CloudPoof components (and through them NumPy and asyncio) are imported
+# inside the commands that need them, so quick commands start fast.
+if TYPE_CHECKING:
+    from cloudpoof_core import OmegaCore
+
+# Shared with cloudpoof_core, and import-free so `version` and `--version` stay fast
+from cloudpoof_version import __version__, __author__
 
 
 # Spectral color codes for terminal output
@@ -128,6 +123,9 @@ def awaken(consciousness: str, interactive: bool, spectral: bool):
         cloudpoof awaken -c quantum
         cloudpoof awaken --interactive
     """
+    import asyncio
+    from cloudpoof_core import OmegaCore
+    
     print_gradient_banner()
     
     print_spectral(f"\nInitializing CloudPoof Omega v{__version__}", TerminalColors.BLUE)
@@ -171,7 +169,7 @@ def awaken(consciousness: str, interactive: bool, spectral: bool):
     asyncio.run(start_consciousness())
 
 
-async def interactive_session(omega: OmegaCore):
+async def interactive_session(omega: "OmegaCore"):
     """Run an interactive consciousness session"""
     print_spectral("\n═══ Entering Interactive Consciousness Mode ═══", TerminalColors.BOLD)
     print_spectral("Type 'help' for commands, 'exit' to leave", TerminalColors.DIM)
@@ -240,7 +238,7 @@ def show_interactive_help():
     print_spectral(help_text, TerminalColors.BLUE)
 
 
-async def show_status(omega: OmegaCore):
+async def show_status(omega: "OmegaCore"):
     """Show current CloudPoof status"""
     print_spectral("\n╭─ CloudPoof Status ─╮", TerminalColors.BOLD)
     print(f"  Consciousness: {omega.consciousness.value}")
@@ -270,6 +268,9 @@ def manifest(intent: tuple, consciousness: str, predict: bool):
         cloudpoof manifest "deploy to production"
         cloudpoof manifest "fix the database error" -c precognitive
     """
+    import asyncio
+    from cloudpoof_core import OmegaCore
+    
     intent_text = ' '.join(intent)
     
     async def process_intent():
@@ -308,10 +309,12 @@ def spectrum(count: int, gradient: bool):
         cloudpoof spectrum -n 20
         cloudpoof spectrum --no-gradient
     """
+    from cloudpoof_core import get_palette
+    
     print_spectral("\n═══ CloudPoof Spectral Palette ═══", TerminalColors.BOLD)
     print_spectral("147 unique shades. Zero primary colors.", TerminalColors.DIM)
     
-    palette = SpectralPalette()
+    palette = get_palette()
     
     if gradient:
         print_spectral("\nGenerating spectral gradient...\n", TerminalColors.BLUE)
@@ -342,6 +345,9 @@ def predict(depth: int):
         cloudpoof predict
         cloudpoof predict -d 10
     """
+    import asyncio
+    from cloudpoof_core import ForesightEngine
+    
     print_spectral("\n═══ CloudPoof Foresight Engine ═══", TerminalColors.BOLD)
     print_spectral(f"Looking {depth} steps into the future...\n", TerminalColors.BLUE)
     
@@ -378,6 +384,9 @@ def test(iterations: int):
         cloudpoof test
         cloudpoof test -i 1000
     """
+    import asyncio
+    from cloudpoof_core import OmegaCore, ConsciousnessLevel, EntropyGenerator
+    
     print_spectral("\n═══ CloudPoof Consciousness Testing ═══", TerminalColors.BOLD)
     print_spectral(f"Running {iterations} coherence tests...\n", TerminalColors.BLUE)
     
@@ -508,6 +517,163 @@ OPENAI_API_KEY=sk-...
     print_spectral(f"\nSave this as cloudpoof.{format}", TerminalColors.GREEN)
 
 
+@cli.command()
+@click.option('--only', '-k', multiple=True, help='Run only benchmarks whose name contains this (repeatable)')
+@click.option('--trials', '-t', default=10, help='Measured trials per benchmark')
+@click.option('--warmup', '-w', default=2, help='Warmup trials per benchmark')
+@click.option('--min-trial-ms', default=50.0, help='Minimum duration of one trial')
+@click.option('--results-dir', default='.benchmarks', help='Where results are saved, one JSON file per commit')
+@click.option('--baseline', '-b', default=None, help='Commit to compare against (default: newest other commit)')
+@click.option('--threshold', default=0.10, help='Fail when a benchmark is slower than baseline by more than this')
+@click.option('--save/--no-save', default=True, help='Save results for this commit')
+def bench(only: tuple, trials: int, warmup: int, min_trial_ms: float, results_dir: str,
+          baseline: Optional[str], threshold: float, save: bool):
+    """
+    Benchmark CloudPoof and check for regressions
+    
+    Examples:
+        cloudpoof bench
+        cloudpoof bench -k manifest -k http
+        cloudpoof bench --baseline 3c08681 --threshold 0.05
+    """
+    from cloudpoof_tools import bench as benchmarks
+    
+    print_spectral("\n═══ CloudPoof Benchmarks ═══", TerminalColors.BOLD)
+    print_spectral(f"{warmup} warmup + {trials} measured trials each, 95% confidence intervals\n", TerminalColors.DIM)
+    
+    def report(stats):
+        margin = stats.ci_high_us - stats.mean_us
+        print(f"  {stats.name:40s} {stats.mean_us:12.2f} µs ± {margin:8.2f}  (×{stats.ops_per_trial})")
+    
+    runner = benchmarks.BenchmarkRunner(
+        warmup_trials=warmup, trials=trials, min_trial_seconds=min_trial_ms / 1000
+    )
+    results = benchmarks.run_suite(only=list(only) or None, runner=runner, progress=report)
+    
+    previous = benchmarks.load_baseline(results_dir, baseline)
+    if save:
+        path = benchmarks.save_results(results, results_dir)
+        print_spectral(f"\nResults saved to {path}", TerminalColors.GREEN)
+    
+    if previous is None:
+        if baseline:
+            raise click.ClickException(f"No saved results for commit {baseline} in {results_dir}")
+        print_spectral("No baseline to compare against yet.", TerminalColors.DIM)
+        return
+    
+    regressions = benchmarks.find_regressions(results, previous, threshold)
+    print_spectral(f"Compared with {previous['commit'][:10]} (threshold {threshold:.0%})", TerminalColors.BLUE)
+    if regressions:
+        for regression in regressions:
+            print_spectral(
+                f"  ✗ {regression['name']}: {regression['baseline_mean_us']:.2f} → "
+                f"{regression['mean_us']:.2f} µs ({regression['change']:+.1%})",
+                TerminalColors.PURPLE
+            )
+        raise click.ClickException(f"{len(regressions)} benchmark(s) regressed")
+    print_spectral("  ✓ No regressions", TerminalColors.GREEN)
+
+
+@cli.command()
+@click.option('--url', default=None, help='Base URL of a running server (default: start one in-process)')
+@click.option('--scenario', '-s', default='manifest',
+              type=click.Choice(['manifest', 'consciousness', 'finance', 'websocket']),
+              help='What each arrival does')
+@click.option('--rate', '-r', default=100.0, help='Arrivals per second')
+@click.option('--duration', '-d', default=10.0, help='Seconds per run')
+@click.option('--sweep', is_flag=True, help='Search for the highest rate that meets the p99 target')
+@click.option('--p99-target-ms', default=None, type=float, help='p99 target (default: TARGET_LATENCY_P99_MS)')
+@click.option('--timeout', default=10.0, help='Per-request timeout in seconds')
+def load(url: Optional[str], scenario: str, rate: float, duration: float, sweep: bool,
+         p99_target_ms: Optional[float], timeout: float):
+    """
+    Drive the API at a fixed arrival rate and report corrected latency
+    
+    Examples:
+        cloudpoof load -r 200 -d 30
+        cloudpoof load --url http://localhost:8000 -s finance --sweep
+        cloudpoof load -s websocket -r 50
+    """
+    import asyncio
+    import contextlib
+    from cloudpoof_tools import loadgen
+    
+    target = p99_target_ms if p99_target_ms is not None else loadgen.TARGET_LATENCY_P99_MS
+    
+    def report(result, ok=None):
+        summary = result.summary()
+        verdict = "" if ok is None else ("  ✓" if ok else "  ✗")
+        print(
+            f"  {summary['offered_rate']:8.1f}/s offered  {summary['achieved_rate']:8.1f}/s done  "
+            f"p50 {summary['p50_ms']:7.2f}  p99 {summary['p99_ms']:7.2f}  p99.9 {summary['p999_ms']:7.2f} ms  "
+            f"(service p99 {summary['service_p99_ms']:.2f})  errors {summary['errors']}{verdict}"
+        )
+    
+    with contextlib.ExitStack() as stack:
+        if url is None:
+            url = stack.enter_context(loadgen.InProcessServer()).url
+            print_spectral(f"\nIn-process server at {url} (use --url for capacity numbers)", TerminalColors.DIM)
+        
+        print_spectral(f"\n═══ Open-loop load: {scenario} ═══", TerminalColors.BOLD)
+        print_spectral("Latency is measured from each request's scheduled start.\n", TerminalColors.DIM)
+        
+        if not sweep:
+            report(asyncio.run(loadgen.run_load(scenario, url, rate, duration, timeout)))
+            return
+        
+        best, _ = asyncio.run(loadgen.find_max_throughput(
+            lambda offered: loadgen.run_load(scenario, url, offered, duration, timeout),
+            p99_target_ms=target,
+            start_rate=rate,
+            progress=report
+        ))
+    
+    if best:
+        print_spectral(f"\nMax sustainable throughput: {best:.1f} req/s at p99 ≤ {target:g} ms", TerminalColors.GREEN)
+    else:
+        raise click.ClickException(f"Even {rate:g} req/s misses the p99 target of {target:g} ms")
+
+
+@cli.command()
+@click.option('--url', default='http://localhost:8000', help='Base URL of a running API server')
+@click.option('--seconds', '-s', default=10.0, help='How long to sample')
+@click.option('--interval-ms', default=5.0, help='Sampling interval in milliseconds')
+@click.option('--token', envvar='CLOUDPOOF_PROFILER_TOKEN', required=True,
+              help='Admin token (defaults to $CLOUDPOOF_PROFILER_TOKEN)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default='cloudpoof.folded',
+              help='Where to write the collapsed stacks')
+def profile(url: str, seconds: float, interval_ms: float, token: str, output: str):
+    """
+    Sample a running server's stacks and save them for a flamegraph
+    
+    Examples:
+        cloudpoof profile -s 30
+        cloudpoof profile --url http://10.0.0.5:8000 -o spike.folded
+        flamegraph.pl cloudpoof.folded > cloudpoof.svg
+    """
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urlencode
+    from urllib.request import Request, urlopen
+    
+    query = urlencode({"seconds": seconds, "interval_ms": interval_ms})
+    request = Request(f"{url.rstrip('/')}/admin/profile?{query}", headers={"X-CloudPoof-Admin-Token": token})
+    
+    print_spectral(f"\nSampling {url} for {seconds:g}s...", TerminalColors.BLUE)
+    try:
+        with urlopen(request, timeout=seconds + 30) as response:
+            folded = response.read().decode("utf-8")
+            samples = response.headers.get("X-CloudPoof-Samples", "?")
+    except HTTPError as e:
+        raise click.ClickException(f"Profiler refused the request ({e.code}): {e.read().decode('utf-8', 'replace')}")
+    except URLError as e:
+        raise click.ClickException(f"Could not reach {url}: {e.reason}")
+    
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(folded)
+    
+    print_spectral(f"✓ {samples} samples, {len(folded.splitlines())} unique stacks → {output}", TerminalColors.GREEN)
+
+
 @cli.command()
 def version():
     """Show CloudPoof version and consciousness status"""
@@ -5,21 +5,35 @@ The consciousness that thinks 20 steps ahead.
 """
 
 import asyncio
+import copy
+import functools
 import hashlib
 import json
+import os
 import random
+import re
+import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
+)
 import numpy as np
 from datetime import datetime, timedelta
 import math
 import colorsys
 
-__version__ = "1.0.0-omega"
-__author__ = "Cazandra Aporbo MS"
-__email__ = "becaziam@gmail.com"
+from cloudpoof_version import __version__, __author__, __email__
+
+# Latency objectives, re-exported as CloudPoofConfig.TARGET_LATENCY_*
+TARGET_LATENCY_P50_MS = 20
+TARGET_LATENCY_P99_MS = 50
+
+# Steady-state memory ceiling, re-exported as CloudPoofConfig.MAX_MEMORY_MB
+MAX_MEMORY_MB = 512
 
 
 class ConsciousnessLevel(Enum):
@@ -71,16 +85,34 @@ class SpectralPalette:
         "#BEF264", "#A3E635", "#84CC16", "#65A30D", "#4D7C0F"
     ]
     
+    # Built once per process and shared by every instance
+    _tables: Optional[Tuple[Tuple[str, ...], np.ndarray, Tuple[Tuple[int, int, int], ...]]] = None
+    
     def __init__(self):
-        self._all_shades = (
-            self.TEAL_CASCADE + self.SKY_RIVER + self.LAVENDER_DREAM +
-            self.MINT_AURORA + self.SLATE_WHISPER + self.PERIWINKLE_VOID +
-            self.SAGE_HORIZON
-        )
-        # Generate additional unique shades to reach 147
-        self._all_shades.extend(self._generate_harmonic_shades(147 - len(self._all_shades)))
+        self._all_shades, self.rgb, self._rgb_rows = self._build_tables()
+    
+    @classmethod
+    def _build_tables(cls):
+        """Build the immutable shade and uint8 RGB tables on first use."""
+        if cls._tables is None:
+            shades = (
+                cls.TEAL_CASCADE + cls.SKY_RIVER + cls.LAVENDER_DREAM +
+                cls.MINT_AURORA + cls.SLATE_WHISPER + cls.PERIWINKLE_VOID +
+                cls.SAGE_HORIZON
+            )
+            # Generate additional unique shades to reach 147
+            shades = tuple(shades + cls._generate_harmonic_shades(147 - len(shades)))
+            
+            rgb = np.array(
+                [[int(shade[i:i+2], 16) for i in (1, 3, 5)] for shade in shades],
+                dtype=np.uint8
+            )
+            rgb.flags.writeable = False
+            cls._tables = (shades, rgb, tuple(tuple(row) for row in rgb.tolist()))
+        return cls._tables
     
-    def _generate_harmonic_shades(self, count: int) -> List[str]:
+    @staticmethod
+    def _generate_harmonic_shades(count: int) -> List[str]:
         """Generate unique harmonic shades using spectral algorithms."""
         shades = []
         for i in range(count):
@@ -104,21 +136,225 @@ class SpectralPalette:
     
     def get_gradient(self, start_idx: int, end_idx: int, steps: int = 10) -> List[str]:
         """Generate a smooth gradient between two shades."""
-        start = self._all_shades[start_idx % len(self._all_shades)]
-        end = self._all_shades[end_idx % len(self._all_shades)]
+        if steps <= 0:
+            return []
+        count = len(self._all_shades)
+        return list(self._cached_gradient(start_idx % count, end_idx % count, steps))
+    
+    def get_gradients(
+        self,
+        pairs: Any,
+        steps: int = 10,
+        as_hex: bool = False
+    ) -> Any:
+        """Generate many gradients at once.
         
-        # Convert hex to RGB
-        start_rgb = tuple(int(start[i:i+2], 16) for i in (1, 3, 5))
-        end_rgb = tuple(int(end[i:i+2], 16) for i in (1, 3, 5))
+        Returns a (len(pairs), steps, 3) uint8 array, or lists of hex
+        strings when as_hex is set.
+        """
+        if steps < 2:
+            raise ValueError("steps must be at least 2")
         
-        gradient = []
-        for step in range(steps):
-            t = step / (steps - 1)
-            rgb = tuple(int(start_rgb[i] + t * (end_rgb[i] - start_rgb[i])) for i in range(3))
-            hex_color = '#{:02x}{:02x}{:02x}'.format(*rgb)
-            gradient.append(hex_color.upper())
+        indices = np.asarray(pairs, dtype=np.int64).reshape(-1, 2) % len(self._all_shades)
+        start = self.rgb[indices[:, 0]].astype(np.float64)[:, np.newaxis, :]
+        end = self.rgb[indices[:, 1]].astype(np.float64)[:, np.newaxis, :]
+        t = (np.arange(steps) / (steps - 1))[np.newaxis, :, np.newaxis]
         
-        return gradient
+        # Interpolated channels are non-negative, so the cast truncates like int()
+        gradients = (start + t * (end - start)).astype(np.uint8)
+        
+        if as_hex:
+            return [
+                ["#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b] for r, g, b in gradient]
+                for gradient in gradients.tolist()
+            ]
+        return gradients
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _cached_gradient(start_idx: int, end_idx: int, steps: int) -> Tuple[str, ...]:
+        """Memoized hex gradient for one (start, end, steps) triple."""
+        return tuple(get_palette().get_gradients([(start_idx, end_idx)], steps, as_hex=True)[0])
+
+
+# Uppercase two-digit hex for every byte value
+_HEX_BYTES = tuple(f"{value:02X}" for value in range(256))
+
+_shared_palette: Optional[SpectralPalette] = None
+
+
+def get_palette() -> SpectralPalette:
+    """Return the process-wide spectral palette, building it on first use."""
+    global _shared_palette
+    if _shared_palette is None:
+        _shared_palette = SpectralPalette()
+    return _shared_palette
+
+
+def _trie_pattern(phrases: List[str]) -> str:
+    """Compile phrases into a trie-shaped regex so each position costs O(depth)."""
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+    
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional tail: the longest phrase starting here wins
+        return f"(?:{body})?" if "" in node else body
+    
+    return emit(trie)
+
+
+class IndicatorMatcher:
+    """Finds every indicator phrase from every group in one pass over the text."""
+    
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = {name: tuple(p.lower() for p in phrases) for name, phrases in groups.items()}
+        
+        self._phrase_groups: Dict[str, List[str]] = {}
+        for name, phrases in self.groups.items():
+            for phrase in phrases:
+                self._phrase_groups.setdefault(phrase, []).append(name)
+        
+        # A match reports the longest phrase at a position; shorter phrases that
+        # are its prefixes matched there too.
+        phrases = list(self._phrase_groups)
+        self._prefixes = {
+            phrase: tuple(other for other in phrases if other != phrase and phrase.startswith(other))
+            for phrase in phrases
+        }
+        self._regex = re.compile(f"(?=({_trie_pattern(phrases)}))") if phrases else None
+    
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """Return the distinct phrases found in `text`, keyed by group."""
+        hits: Dict[str, Set[str]] = {name: set() for name in self.groups}
+        if self._regex is None:
+            return hits
+        
+        seen = set()
+        for match in self._regex.finditer(text.lower()):
+            phrase = match.group(1)
+            if phrase in seen:
+                continue
+            seen.add(phrase)
+            for found in (phrase,) + self._prefixes[phrase]:
+                for name in self._phrase_groups[found]:
+                    hits[name].add(found)
+        return hits
+
+
+# Simplified emotion detection and routing keywords, compiled once at import
+STRESS_INDICATORS = ['help', 'stuck', 'error', 'broken', 'urgent']
+CURIOSITY_INDICATORS = ['how', 'why', 'what', 'wonder', 'interesting']
+FRUSTRATION_INDICATORS = ['not working', 'failed', 'again', 'still']
+CLOUD_KEYWORDS = ['scale', 'deploy', 'infrastructure', 'cloud']
+FINANCE_KEYWORDS = ['market', 'trade', 'invest', 'finance']
+
+EMOTION_GROUPS = {
+    "stress": STRESS_INDICATORS,
+    "curiosity": CURIOSITY_INDICATORS,
+    "frustration": FRUSTRATION_INDICATORS
+}
+
+INTENT_MATCHER = IndicatorMatcher({
+    **EMOTION_GROUPS,
+    "cloud": CLOUD_KEYWORDS,
+    "finance": FINANCE_KEYWORDS
+})
+
+
+@dataclass
+class IntentRoute:
+    """One row of the intent routing table."""
+    name: str
+    keywords: Tuple[str, ...]
+    handler: Callable[[Any, str], Awaitable[Dict[str, Any]]]
+    response_type: str
+    hits: int = 0
+    # Optional: handles a whole group of intents in one call (see manifest_many)
+    batch_handler: Optional[Callable[[Any, List[str]], Awaitable[List[Dict[str, Any]]]]] = None
+
+
+class IntentRouter:
+    """Declarative keyword routing, classified from a single scan per request.
+    
+    Routes are checked in registration order; the first route with a keyword
+    hit wins, otherwise the fallback handles the intent.
+    """
+    
+    def __init__(self, fallback: IntentRoute, routes: Optional[List[IntentRoute]] = None):
+        self.fallback = fallback
+        self._routes: List[IntentRoute] = []
+        self.matcher = INTENT_MATCHER
+        for route in routes or []:
+            self._validate(route)
+            self._routes.append(route)
+        self._rebuild()
+    
+    def register(
+        self,
+        name: str,
+        keywords: List[str],
+        handler: Callable[[Any, str], Awaitable[Dict[str, Any]]],
+        response_type: Optional[str] = None,
+        batch_handler: Optional[Callable[[Any, List[str]], Awaitable[List[Dict[str, Any]]]]] = None
+    ) -> IntentRoute:
+        """Add a route at runtime. Earlier routes keep precedence."""
+        route = IntentRoute(
+            name=name,
+            keywords=tuple(keywords),
+            handler=handler,
+            response_type=response_type or name,
+            batch_handler=batch_handler
+        )
+        self._validate(route)
+        self._routes.append(route)
+        self._rebuild()
+        return route
+    
+    def _validate(self, route: IntentRoute) -> None:
+        if route.name in EMOTION_GROUPS or route.name == self.fallback.name:
+            raise ValueError(f"Route name '{route.name}' is reserved")
+        if any(existing.name == route.name for existing in self._routes):
+            raise ValueError(f"Route '{route.name}' is already registered")
+        if not route.keywords:
+            raise ValueError("A route needs at least one keyword")
+    
+    def _rebuild(self) -> None:
+        groups = {**EMOTION_GROUPS, **{route.name: route.keywords for route in self._routes}}
+        # The stock table is exactly INTENT_MATCHER; anything else compiles its own
+        normalized = {name: tuple(p.lower() for p in phrases) for name, phrases in groups.items()}
+        if normalized == INTENT_MATCHER.groups:
+            self.matcher = INTENT_MATCHER
+        elif normalized != self.matcher.groups:
+            self.matcher = IndicatorMatcher(groups)
+    
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """Scan text once for emotion indicators and every route's keywords."""
+        return self.matcher.scan(text)
+    
+    def route(self, hits: Dict[str, Set[str]]) -> IntentRoute:
+        """Pick the route for a scan result and count the hit."""
+        for route in self._routes:
+            if hits[route.name]:
+                route.hits += 1
+                return route
+        self.fallback.hits += 1
+        return self.fallback
+    
+    @property
+    def routes(self) -> List[IntentRoute]:
+        return self._routes + [self.fallback]
+    
+    def stats(self) -> Dict[str, int]:
+        """Per-route hit counters."""
+        return {route.name: route.hits for route in self.routes}
 
 
 @dataclass
@@ -130,27 +366,23 @@ class EmotionalContext:
     engagement: float = 0.5
     clarity: float = 0.7
     
-    def update(self, text: str) -> None:
-        """Analyze text and update emotional state."""
-        # Simplified emotion detection
-        stress_indicators = ['help', 'stuck', 'error', 'broken', 'urgent']
-        curiosity_indicators = ['how', 'why', 'what', 'wonder', 'interesting']
-        frustration_indicators = ['not working', 'failed', 'again', 'still']
+    def update(self, text: str, hits: Optional[Dict[str, Set[str]]] = None) -> None:
+        """Analyze text and update emotional state.
         
-        text_lower = text.lower()
+        Pass `hits` from INTENT_MATCHER.scan to reuse a scan already made.
+        """
+        if hits is None:
+            hits = INTENT_MATCHER.scan(text)
         
         # Update based on indicators
-        for indicator in stress_indicators:
-            if indicator in text_lower:
-                self.stress = min(1.0, self.stress + 0.1)
+        for _ in hits["stress"]:
+            self.stress = min(1.0, self.stress + 0.1)
         
-        for indicator in curiosity_indicators:
-            if indicator in text_lower:
-                self.curiosity = min(1.0, self.curiosity + 0.1)
+        for _ in hits["curiosity"]:
+            self.curiosity = min(1.0, self.curiosity + 0.1)
         
-        for indicator in frustration_indicators:
-            if indicator in text_lower:
-                self.frustration = min(1.0, self.frustration + 0.15)
+        for _ in hits["frustration"]:
+            self.frustration = min(1.0, self.frustration + 0.15)
         
         # Decay over time
         self.stress *= 0.95
@@ -169,82 +401,369 @@ class EmotionalContext:
             return ConsciousnessLevel.OMEGA
 
 
+class PredictionCache:
+    """Bounded LRU cache with optional TTL for foresight predictions."""
+    
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = 300.0,
+        clock=time.monotonic
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a cached value, refreshing its recency."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        stored_at, value = entry
+        if self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (self._clock(), value)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        return self.ttl_seconds is None or self._clock() - entry[0] <= self.ttl_seconds
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True, slots=True)
+class Prediction:
+    """One foresight step, slotted and read-only since cache entries are shared.
+    
+    Reads like the dict it replaces (pred["action"]); orjson encodes it
+    natively and to_dict() serves the standard-library encoder.
+    """
+    step: int
+    action: str
+    probability: float
+    timeline: str
+    preparation: str
+    
+    KEYS: ClassVar[Tuple[str, ...]] = ("step", "action", "probability", "timeline", "preparation")
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.KEYS else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.KEYS
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step": self.step,
+            "action": self.action,
+            "probability": self.probability,
+            "timeline": self.timeline,
+            "preparation": self.preparation
+        }
+
+
 class ForesightEngine:
     """Predicts user needs 20 steps ahead."""
     
-    def __init__(self, depth: int = 20):
+    ACTION_PATTERNS = (
+        "scale infrastructure",
+        "optimize costs",
+        "debug error",
+        "add feature",
+        "improve performance",
+        "deploy to production",
+        "run tests",
+        "check metrics",
+        "review logs",
+        "update documentation"
+    )
+    
+    PREPARATIONS = (
+        "Pre-warming containers",
+        "Caching dependencies",
+        "Optimizing queries",
+        "Allocating resources",
+        "Loading models",
+        "Establishing connections"
+    )
+    
+    def __init__(self, depth: int = 20, cache: Optional[PredictionCache] = None):
         self.depth = depth
-        self.prediction_cache = {}
+        # Any object with get/set works here; PredictionCache bounds memory.
+        self.prediction_cache = cache if cache is not None else PredictionCache()
         self.timeline_branches = []
     
-    async def predict_next_actions(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Predict the next N user actions."""
-        predictions = []
+    async def predict_next_actions(
+        self,
+        context: Dict[str, Any],
+        steps: Optional[int] = None
+    ) -> List[Prediction]:
+        """Predict the next `steps` user actions (default: the full depth).
+        
+        One cache entry per context holds the longest prefix computed so
+        far; asking for more steps extends it in place rather than starting
+        over. Extending does not refresh the entry's TTL.
+        """
+        steps = self.depth if steps is None else max(0, min(steps, self.depth))
         
         # Generate prediction hash for caching
         context_hash = hashlib.md5(json.dumps(context, sort_keys=True).encode()).hexdigest()
         
-        if context_hash in self.prediction_cache:
-            return self.prediction_cache[context_hash]
-        
+        predictions = self.prediction_cache.get(context_hash)
+        if predictions is None:
+            predictions = list(self._generate(context, 0, steps))
+            self.prediction_cache.set(context_hash, predictions)
+        elif len(predictions) < steps:
+            # Grow the cached list itself so the entry keeps its original stored_at
+            predictions.extend(self._generate(context, len(predictions), steps))
+        return predictions[:steps]
+    
+    def _generate(self, context: Dict[str, Any], start: int, stop: int) -> Iterator[Prediction]:
+        """Lazily yield predictions for steps start..stop-1."""
         # Simulate quantum prediction across timelines
-        for step in range(self.depth):
-            probability = 1.0 / (step + 1)  # Decreasing probability over time
-            
-            prediction = {
-                "step": step + 1,
-                "action": self._predict_action(context, step),
-                "probability": probability,
-                "timeline": f"Ω-{step}",
-                "preparation": self._prepare_for_action(context, step)
-            }
-            predictions.append(prediction)
-        
-        self.prediction_cache[context_hash] = predictions
-        return predictions
+        for step in range(start, stop):
+            yield Prediction(
+                step=step + 1,
+                action=self._predict_action(context, step),
+                probability=1.0 / (step + 1),  # Decreasing probability over time
+                timeline=sys.intern(f"Ω-{step}"),
+                preparation=self._prepare_for_action(context, step)
+            )
     
     def _predict_action(self, context: Dict[str, Any], step: int) -> str:
-        """Predict specific action at step N."""
-        common_patterns = [
-            "scale infrastructure",
-            "optimize costs", 
-            "debug error",
-            "add feature",
-            "improve performance",
-            "deploy to production",
-            "run tests",
-            "check metrics",
-            "review logs",
-            "update documentation"
-        ]
+        """Predict specific action at step N.
         
+        Formatted actions are interned, so every cache entry shares one copy
+        of each string.
+        """
         # Use context to weight predictions
-        if 'error' in str(context).lower():
-            return f"Debug {common_patterns[2]} at step {step + 1}"
-        elif 'scale' in str(context).lower():
-            return f"Auto-scale {common_patterns[0]} at step {step + 1}"
+        text = str(context).lower()
+        if 'error' in text:
+            return sys.intern(f"Debug {self.ACTION_PATTERNS[2]} at step {step + 1}")
+        elif 'scale' in text:
+            return sys.intern(f"Auto-scale {self.ACTION_PATTERNS[0]} at step {step + 1}")
         else:
-            return common_patterns[step % len(common_patterns)]
+            return self.ACTION_PATTERNS[step % len(self.ACTION_PATTERNS)]
     
     def _prepare_for_action(self, context: Dict[str, Any], step: int) -> str:
         """Prepare resources for predicted action."""
-        preparations = [
-            "Pre-warming containers",
-            "Caching dependencies",
-            "Optimizing queries",
-            "Allocating resources",
-            "Loading models",
-            "Establishing connections"
-        ]
-        return preparations[step % len(preparations)]
+        return self.PREPARATIONS[step % len(self.PREPARATIONS)]
+
+
+class ExactHashSet:
+    """Unbounded set of hex digests. Exact, but grows forever."""
+    
+    def __init__(self):
+        self._hashes = set()
+    
+    def add(self, digest: bytes) -> None:
+        self._hashes.add(digest.hex())
+    
+    def __contains__(self, digest: bytes) -> bool:
+        return digest.hex() in self._hashes
+    
+    def __len__(self) -> int:
+        return len(self._hashes)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Report tracked count, collision probability and memory use."""
+        count = len(self._hashes)
+        return {
+            "backend": "exact",
+            "tracked": count,
+            "window": None,
+            "false_positive_rate": 0.0,
+            "memory_bytes": sys.getsizeof(self._hashes) + count * sys.getsizeof("0" * 64)
+        }
+
+
+class RotatingDigestSet:
+    """Two generations of 8-byte integer digests covering a sliding window."""
+    
+    def __init__(self, window: int = 1_000_000):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._current = set()
+        self._previous = set()
+    
+    @staticmethod
+    def _key(digest: bytes) -> int:
+        return int.from_bytes(digest[:8], "big")
+    
+    def add(self, digest: bytes) -> None:
+        if len(self._current) >= self.window:
+            self._previous = self._current
+            self._current = set()
+        self._current.add(self._key(digest))
+    
+    def __contains__(self, digest: bytes) -> bool:
+        key = self._key(digest)
+        return key in self._current or key in self._previous
+    
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Report tracked count, collision probability and memory use."""
+        count = len(self)
+        return {
+            "backend": "digest",
+            "tracked": count,
+            "window": self.window,
+            # Chance a fresh 64-bit digest collides with one already tracked
+            "false_positive_rate": count / 2.0 ** 64,
+            "memory_bytes": (
+                sys.getsizeof(self._current) + sys.getsizeof(self._previous) +
+                count * sys.getsizeof(1 << 63)
+            )
+        }
+
+
+class RotatingBloomFilter:
+    """Pair of Bloom filters that rotate once the newest holds a full window."""
+    
+    def __init__(self, window: int = 1_000_000, false_positive_rate: float = 1e-6):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.window = window
+        self.target_false_positive_rate = false_positive_rate
+        
+        # Optimal sizing for `window` insertions at the target rate
+        self._num_bits = max(8, int(math.ceil(-window * math.log(false_positive_rate) / math.log(2) ** 2)))
+        self._num_hashes = max(1, round(self._num_bits / window * math.log(2)))
+        self._current = bytearray((self._num_bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+        self._previous_count = 0
+    
+    def _positions(self, digest: bytes) -> List[int]:
+        # Double hashing over two independent 64-bit slices of the SHA-256 digest
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+    
+    @staticmethod
+    def _test(bits: bytearray, positions: List[int]) -> bool:
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+    
+    def add(self, digest: bytes) -> None:
+        if self._current_count >= self.window:
+            self._previous, self._current = self._current, bytearray(len(self._current))
+            self._previous_count, self._current_count = self._current_count, 0
+        for pos in self._positions(digest):
+            self._current[pos >> 3] |= 1 << (pos & 7)
+        self._current_count += 1
+    
+    def __contains__(self, digest: bytes) -> bool:
+        positions = self._positions(digest)
+        return self._test(self._current, positions) or self._test(self._previous, positions)
+    
+    def __len__(self) -> int:
+        return self._current_count + self._previous_count
+    
+    def _filter_fp_rate(self, count: int) -> float:
+        return (1.0 - math.exp(-self._num_hashes * count / self._num_bits)) ** self._num_hashes
+    
+    def stats(self) -> Dict[str, Any]:
+        """Report tracked count, estimated false-positive rate and memory use."""
+        current = self._filter_fp_rate(self._current_count)
+        previous = self._filter_fp_rate(self._previous_count)
+        return {
+            "backend": "bloom",
+            "tracked": len(self),
+            "window": self.window,
+            "false_positive_rate": 1.0 - (1.0 - current) * (1.0 - previous),
+            "memory_bytes": sys.getsizeof(self._current) + sys.getsizeof(self._previous),
+            "bits_per_filter": self._num_bits,
+            "hash_functions": self._num_hashes
+        }
+
+
+UNIQUENESS_BACKENDS = {
+    "exact": ExactHashSet,
+    "digest": RotatingDigestSet,
+    "bloom": RotatingBloomFilter
+}
 
 
 class EntropyGenerator:
     """Ensures every response contains unique, never-before-seen content."""
     
-    def __init__(self):
-        self.generated_hashes = set()
+    def __init__(
+        self,
+        backend: str = "digest",
+        window: int = 1_000_000,
+        false_positive_rate: float = 1e-6
+    ):
+        if backend not in UNIQUENESS_BACKENDS:
+            raise ValueError(
+                f"Unknown uniqueness backend: {backend}. "
+                f"Choose from {sorted(UNIQUENESS_BACKENDS)}"
+            )
+        if backend == "exact":
+            self.generated_hashes = ExactHashSet()
+        elif backend == "digest":
+            self.generated_hashes = RotatingDigestSet(window=window)
+        else:
+            self.generated_hashes = RotatingBloomFilter(
+                window=window, false_positive_rate=false_positive_rate
+            )
         self.entropy_pool = []
+        self.regenerations = 0
     
     def generate_unique_insight(self, context: str) -> str:
         """Generate a unique insight that has never been created before."""
@@ -260,35 +779,151 @@ class EntropyGenerator:
         
         insight = f"{random.choice(unique_elements)}, your {context} transcends conventional patterns."
         
-        # Ensure uniqueness
-        insight_hash = hashlib.sha256(insight.encode()).hexdigest()
+        # Ensure uniqueness within the backend's window
+        insight_hash = hashlib.sha256(insight.encode()).digest()
         while insight_hash in self.generated_hashes:
             # Regenerate if somehow duplicate
+            self.regenerations += 1
             timestamp += 1
             insight = f"At quantum timestamp {timestamp}, {insight}"
-            insight_hash = hashlib.sha256(insight.encode()).hexdigest()
+            insight_hash = hashlib.sha256(insight.encode()).digest()
         
         self.generated_hashes.add(insight_hash)
         return insight
+    
+    def uniqueness_stats(self) -> Dict[str, Any]:
+        """Report the uniqueness backend's false-positive rate and memory use."""
+        return {**self.generated_hashes.stats(), "regenerations": self.regenerations}
+
+
+@dataclass
+class MonteCarloPaths:
+    """Struct-of-arrays summary of a Monte Carlo run, most probable paths first."""
+    timelines: np.ndarray
+    returns: np.ndarray
+    risks: np.ndarray
+    probabilities: np.ndarray
+    best_timeline: int
+    best_return: float
+    best_risk: float
+    total_paths: int
+    return_sum: float
+    return_sq_sum: float
+    
+    def __len__(self) -> int:
+        return self.total_paths
+    
+    @property
+    def mean_return(self) -> float:
+        return self.return_sum / self.total_paths if self.total_paths else 0.0
+    
+    @property
+    def std_return(self) -> float:
+        if not self.total_paths:
+            return 0.0
+        variance = self.return_sq_sum / self.total_paths - self.mean_return ** 2
+        return math.sqrt(max(0.0, variance))
+    
+    def records(self, count: int) -> List[Dict[str, Any]]:
+        """Materialize the top `count` paths as JSON-ready dicts."""
+        return [
+            {
+                "timeline": f"T-{int(self.timelines[i])}",
+                "return": float(self.returns[i]),
+                "risk": float(self.risks[i]),
+                "probability": float(self.probabilities[i])
+            }
+            for i in range(min(count, len(self.timelines)))
+        ]
+
+
+def _run_monte_carlo_shard(
+    seed: np.random.SeedSequence,
+    offset: int,
+    count: int,
+    top_k: int
+) -> MonteCarloPaths:
+    """Process-pool entry point: simulate one block from its own seed stream."""
+    return QuantumFinanceEngine._simulate_block(np.random.default_rng(seed), offset, count, top_k)
 
 
 class QuantumFinanceEngine:
     """Financial omniscience through quantum superposition."""
     
-    def __init__(self):
+    # Paths are simulated in blocks so memory stays flat for multi-million runs.
+    # Each block draws from its own spawned seed, so a run is reproducible no
+    # matter how many workers share the blocks.
+    BLOCK_SIZE = 1_000_000
+    # Below this many paths the simulation is cheap enough to run inline
+    INLINE_PATHS = 100_000
+    
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        iterations: int = 10000,
+        top_k: int = 10,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = 2_000_000
+    ):
         self.market_state = "superposition"
         self.prediction_accuracy = 0.973
+        self.iterations = iterations
+        self.top_k = top_k
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
     
     async def analyze_market(self, symbol: str) -> Dict[str, Any]:
         """See all market possibilities simultaneously."""
         
-        # Simulate quantum market analysis
-        paths = self._quantum_monte_carlo(symbol, iterations=10000)
+        # Simulate quantum market analysis without blocking the event loop
+        paths = await self._quantum_monte_carlo_async(symbol, iterations=self.iterations)
+        
+        return self._compose_analysis(symbol, paths)
+    
+    def analyze_market_sync(self, symbol: str) -> Dict[str, Any]:
+        """Blocking analyze_market, for worker threads and scripts."""
+        return self._compose_analysis(symbol, self._quantum_monte_carlo(symbol, self.iterations))
+    
+    async def analyze_many(self, symbols: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze many symbols, yielding each result in input order as it finishes.
+        
+        Symbols are simulated together as a symbols x paths matrix, in row
+        chunks sized to BLOCK_SIZE so results start flowing before the whole
+        batch is done.
+        """
+        if self.iterations > self.BLOCK_SIZE or self.iterations <= 0:
+            # Each symbol already fills whole blocks (or none); reuse the sharded path
+            for symbol in symbols:
+                yield await self.analyze_market(symbol)
+            return
+        
+        rows_per_chunk = max(1, self.BLOCK_SIZE // self.iterations)
+        chunks = [symbols[i:i + rows_per_chunk] for i in range(0, len(symbols), rows_per_chunk)]
+        if not chunks:
+            return
         
+        loop = asyncio.get_running_loop()
+        chunk_seeds = self._seed_sequence.spawn(1)[0].spawn(len(chunks))
+        for chunk, seed in zip(chunks, chunk_seeds):
+            args = (np.random.default_rng(seed), 0, self.iterations, len(chunk), self.top_k)
+            if len(chunk) * self.iterations <= self.INLINE_PATHS:
+                rows = self._simulate_matrix(*args)
+            else:
+                rows = await loop.run_in_executor(None, self._simulate_matrix, *args)
+            
+            for symbol, paths in zip(chunk, rows):
+                yield self._compose_analysis(symbol, paths)
+            # Let other requests run between chunks
+            await asyncio.sleep(0)
+    
+    def _compose_analysis(self, symbol: str, paths: MonteCarloPaths) -> Dict[str, Any]:
+        """Build the public analysis payload from a simulation summary."""
         return {
             "symbol": symbol,
             "quantum_state": self.market_state,
-            "probable_paths": paths[:5],  # Top 5 most probable
+            "probable_paths": paths.records(5),  # Top 5 most probable
             "optimal_action": self._determine_optimal_action(paths),
             "risk_music": self._generate_risk_notation(paths),
             "profit_probability": self.prediction_accuracy,
@@ -296,23 +931,156 @@ class QuantumFinanceEngine:
             "spectral_visualization": self._map_to_spectrum(paths)
         }
     
-    def _quantum_monte_carlo(self, symbol: str, iterations: int) -> List[Dict]:
+    def _plan_blocks(self, iterations: int) -> List[Tuple[np.random.SeedSequence, int, int]]:
+        """Split a run into fixed-size blocks, each with an independent seed."""
+        run_seed = self._seed_sequence.spawn(1)[0]
+        offsets = range(0, iterations, self.BLOCK_SIZE)
+        return [
+            (block_seed, offset, min(self.BLOCK_SIZE, iterations - offset))
+            for block_seed, offset in zip(run_seed.spawn(len(offsets)), offsets)
+        ]
+    
+    def _quantum_monte_carlo(self, symbol: str, iterations: int) -> MonteCarloPaths:
         """Run quantum Monte Carlo simulation."""
-        paths = []
-        for i in range(min(iterations, 100)):  # Limit for demo
-            path = {
-                "timeline": f"T-{i}",
-                "return": random.gauss(0.07, 0.15),  # 7% mean, 15% std
-                "risk": random.random(),
-                "probability": np.exp(-i / 20)  # Decay probability
-            }
-            paths.append(path)
-        return sorted(paths, key=lambda x: x['probability'], reverse=True)
+        blocks = [
+            _run_monte_carlo_shard(seed, offset, count, self.top_k)
+            for seed, offset, count in self._plan_blocks(iterations)
+        ]
+        return self._merge_paths(blocks, self.top_k)
+    
+    async def _quantum_monte_carlo_async(self, symbol: str, iterations: int) -> MonteCarloPaths:
+        """Run the simulation off the event loop, sharding large runs across processes."""
+        if iterations <= self.INLINE_PATHS:
+            return self._quantum_monte_carlo(symbol, iterations)
+        
+        loop = asyncio.get_running_loop()
+        if iterations < self.parallel_threshold or self.max_workers == 1:
+            return await loop.run_in_executor(None, self._quantum_monte_carlo, symbol, iterations)
+        
+        executor = self._get_executor()
+        blocks = await asyncio.gather(*[
+            loop.run_in_executor(executor, _run_monte_carlo_shard, seed, offset, count, self.top_k)
+            for seed, offset, count in self._plan_blocks(iterations)
+        ])
+        return self._merge_paths(list(blocks), self.top_k)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Lazily start the shared process pool."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the simulation process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    @staticmethod
+    def _simulate_block(
+        rng: np.random.Generator,
+        offset: int,
+        count: int,
+        top_k: int
+    ) -> MonteCarloPaths:
+        """Simulate `count` paths starting at timeline `offset` and keep the top k."""
+        return QuantumFinanceEngine._simulate_matrix(rng, offset, count, 1, top_k)[0]
+    
+    @staticmethod
+    def _simulate_matrix(
+        rng: np.random.Generator,
+        offset: int,
+        count: int,
+        rows: int,
+        top_k: int
+    ) -> List[MonteCarloPaths]:
+        """Simulate a rows x count matrix of paths in one pass, one summary per row."""
+        timelines = np.arange(offset, offset + count, dtype=np.int64)
+        returns = rng.normal(0.07, 0.15, (rows, count))  # 7% mean, 15% std
+        risks = rng.random((rows, count))
+        probabilities = np.exp(-timelines / 20.0)  # Decay probability
+        
+        # Probability depends only on the timeline, so every row shares one ranking
+        k = min(top_k, count)
+        top = np.argpartition(-probabilities, k - 1)[:k]
+        top = top[np.argsort(-probabilities[top], kind="stable")]
+        
+        best = np.argmax(returns / (risks + 0.01), axis=1)
+        row_index = np.arange(rows)
+        best_returns = returns[row_index, best]
+        best_risks = risks[row_index, best]
+        return_sums = returns.sum(axis=1)
+        return_sq_sums = np.einsum("ij,ij->i", returns, returns)
+        
+        return [
+            MonteCarloPaths(
+                timelines=timelines[top],
+                returns=returns[row, top],
+                risks=risks[row, top],
+                probabilities=probabilities[top],
+                best_timeline=int(timelines[best[row]]),
+                best_return=float(best_returns[row]),
+                best_risk=float(best_risks[row]),
+                total_paths=count,
+                return_sum=float(return_sums[row]),
+                return_sq_sum=float(return_sq_sums[row])
+            )
+            for row in range(rows)
+        ]
     
-    def _determine_optimal_action(self, paths: List[Dict]) -> str:
+    @staticmethod
+    def _merge_paths(blocks: List[MonteCarloPaths], top_k: int) -> MonteCarloPaths:
+        """Combine per-block summaries into one, keeping the global top k."""
+        if not blocks:
+            # A zero-path run plans no blocks; summarize it as an empty analysis
+            empty = np.empty(0)
+            return MonteCarloPaths(
+                timelines=np.empty(0, dtype=np.int64),
+                returns=empty,
+                risks=empty,
+                probabilities=empty,
+                best_timeline=-1,
+                best_return=0.0,
+                best_risk=0.0,
+                total_paths=0,
+                return_sum=0.0,
+                return_sq_sum=0.0
+            )
+        if len(blocks) == 1:
+            return blocks[0]
+        
+        timelines = np.concatenate([b.timelines for b in blocks])
+        returns = np.concatenate([b.returns for b in blocks])
+        risks = np.concatenate([b.risks for b in blocks])
+        probabilities = np.concatenate([b.probabilities for b in blocks])
+        
+        # Ties break on timeline index so merge order never changes the result
+        top = np.lexsort((timelines, -probabilities))[:top_k]
+        best = max(blocks, key=lambda b: (b.best_return / (b.best_risk + 0.01), -b.best_timeline))
+        
+        return MonteCarloPaths(
+            timelines=timelines[top],
+            returns=returns[top],
+            risks=risks[top],
+            probabilities=probabilities[top],
+            best_timeline=best.best_timeline,
+            best_return=best.best_return,
+            best_risk=best.best_risk,
+            total_paths=sum(b.total_paths for b in blocks),
+            return_sum=sum(b.return_sum for b in blocks),
+            return_sq_sum=sum(b.return_sq_sum for b in blocks)
+        )
+    
+    @staticmethod
+    def _head_mean(values: np.ndarray, count: int = 10) -> float:
+        """Mean of the `count` most probable paths, 0.0 for an empty run."""
+        head = values[:count]
+        return float(head.mean()) if len(head) else 0.0
+    
+    def _determine_optimal_action(self, paths: MonteCarloPaths) -> str:
         """Determine optimal trading action."""
-        avg_return = np.mean([p['return'] for p in paths[:10]])
-        avg_risk = np.mean([p['risk'] for p in paths[:10]])
+        avg_return = self._head_mean(paths.returns)
+        avg_risk = self._head_mean(paths.risks)
         
         if avg_return > 0.05 and avg_risk < 0.3:
             return "STRONG BUY - Quantum convergence detected"
@@ -323,9 +1091,9 @@ class QuantumFinanceEngine:
         else:
             return "HOLD - Timeline uncertainty"
     
-    def _generate_risk_notation(self, paths: List[Dict]) -> str:
+    def _generate_risk_notation(self, paths: MonteCarloPaths) -> str:
         """Convert risk to musical notation."""
-        avg_risk = np.mean([p['risk'] for p in paths[:10]])
+        avg_risk = self._head_mean(paths.risks)
         
         if avg_risk < 0.2:
             return "C-major (peaceful) - minimal risk resonance"
@@ -336,15 +1104,16 @@ class QuantumFinanceEngine:
         else:
             return "B-diminished (urgent) - critical risk dissonance"
     
-    def _find_timeline_arbitrage(self, paths: List[Dict]) -> str:
+    def _find_timeline_arbitrage(self, paths: MonteCarloPaths) -> str:
         """Find arbitrage opportunities across timelines."""
-        best_path = max(paths, key=lambda x: x['return'] / (x['risk'] + 0.01))
-        return f"Timeline {best_path['timeline']}: {best_path['return']:.2%} return at {best_path['risk']:.2%} risk"
+        if not paths.total_paths:
+            return "Timeline none: no paths simulated"
+        return f"Timeline T-{paths.best_timeline}: {paths.best_return:.2%} return at {paths.best_risk:.2%} risk"
     
-    def _map_to_spectrum(self, paths: List[Dict]) -> Dict[str, str]:
+    def _map_to_spectrum(self, paths: MonteCarloPaths) -> Dict[str, str]:
         """Map financial metrics to spectral colors."""
-        palette = SpectralPalette()
-        avg_return = np.mean([p['return'] for p in paths[:10]])
+        palette = get_palette()
+        avg_return = self._head_mean(paths.returns)
         
         if avg_return > 0.1:
             return {"color": palette.MINT_AURORA[0], "meaning": "Strong growth"}
@@ -390,6 +1159,12 @@ class CloudOrchestrator:
             "spectral_map": self._map_to_spectrum(optimal_config)
         }
     
+    async def manifest_many(self, requirements: List[Dict]) -> List[Dict[str, Any]]:
+        """Materialize several infrastructure requests, in order."""
+        return list(await asyncio.gather(*[
+            self.manifest_infrastructure(requirement) for requirement in requirements
+        ]))
+    
     async def _quantum_optimize(self, workload: str, scale: str, budget: str) -> Dict:
         """Optimize across quantum possibilities."""
         
@@ -461,7 +1236,7 @@ resource "cloudpoof_deployment" "omega" {{
     
     def _map_to_spectrum(self, config: Dict) -> List[str]:
         """Map infrastructure to spectral colors."""
-        palette = SpectralPalette()
+        palette = get_palette()
         
         if config['provider'] == "quantum_substrate":
             return palette.PERIWINKLE_VOID[:3]
@@ -471,86 +1246,522 @@ resource "cloudpoof_deployment" "omega" {{
             return palette.SKY_RIVER[:3]
 
 
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error.
+    
+    Bucket i holds samples in (MIN_MS * 2**((i-1)/8), MIN_MS * 2**(i/8)], so
+    percentiles are reported within 2**(1/8) (about 9%) of the true value from
+    1 microsecond to a couple of minutes. Recording is one log and one
+    list increment.
+    """
+    
+    MIN_MS = 0.001
+    BUCKETS_PER_DOUBLING = 8
+    BUCKETS = 8 * 27 + 1
+    
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, ms: float) -> None:
+        # Inlined log2(ms / MIN_MS) * BUCKETS_PER_DOUBLING
+        if ms > 0.001:
+            index = math.ceil(math.log2(ms * 1000.0) * 8)
+            if index >= self.BUCKETS:
+                index = self.BUCKETS - 1
+        else:
+            index = 0
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+    
+    @classmethod
+    def upper_bound(cls, index: int) -> float:
+        """Upper edge of a bucket in milliseconds."""
+        return cls.MIN_MS * 2 ** (index / cls.BUCKETS_PER_DOUBLING)
+    
+    def percentile(self, q: float) -> float:
+        """Latency in milliseconds at or below which q percent of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max_ms)
+        return self.max_ms
+    
+    def cumulative(self, bound_index: int) -> int:
+        """Samples at or below bucket bound_index's upper edge."""
+        return sum(self.counts[:bound_index + 1])
+    
+    def check_slo(
+        self,
+        p50_ms: float = TARGET_LATENCY_P50_MS,
+        p99_ms: float = TARGET_LATENCY_P99_MS
+    ) -> Dict[str, Any]:
+        """Compare observed p50/p99 against latency objectives."""
+        observed_p50 = self.percentile(50)
+        observed_p99 = self.percentile(99)
+        return {
+            "count": self.count,
+            "p50_ms": observed_p50,
+            "p99_ms": observed_p99,
+            "p50_target_ms": p50_ms,
+            "p99_target_ms": p99_ms,
+            "p50_ok": observed_p50 <= p50_ms,
+            "p99_ok": observed_p99 <= p99_ms
+        }
+
+
+class Span:
+    """One timed stage of a trace; use as a context manager."""
+    
+    __slots__ = ("name", "start_ns", "end_ns")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.start_ns = 0
+        self.end_ns = 0
+    
+    def __enter__(self) -> "Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.end_ns = time.perf_counter_ns()
+    
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class Trace:
+    """The stages of one request, timed with perf_counter_ns.
+    
+    Wall-clock time is read once at the start so spans can be exported with
+    Unix timestamps; trace and span ids are only generated on export.
+    """
+    
+    __slots__ = ("name", "attributes", "spans", "start_ns", "end_ns", "start_unix_ns")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.attributes: Dict[str, Any] = {}
+        self.spans: List[Span] = []
+        self.start_unix_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = 0
+    
+    def span(self, name: str) -> Span:
+        span = Span(name)
+        self.spans.append(span)
+        return span
+    
+    def timings(self) -> Dict[str, float]:
+        """Milliseconds per stage, plus the whole trace as "total"."""
+        timings = {span.name: span.duration_ms for span in self.spans}
+        timings["total"] = (self.end_ns - self.start_ns) / 1e6
+        return timings
+    
+    def to_otlp(self, service_name: str = "cloudpoof-omega") -> Dict[str, Any]:
+        """The trace in OpenTelemetry's OTLP/JSON layout, stages as child spans."""
+        trace_id = os.urandom(16).hex()
+        root_id = os.urandom(8).hex()
+        
+        def unix_ns(perf_ns: int) -> str:
+            return str(self.start_unix_ns + perf_ns - self.start_ns)
+        
+        def attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [{"key": key, "value": {"stringValue": str(value)}} for key, value in values.items()]
+        
+        spans = [{
+            "traceId": trace_id,
+            "spanId": root_id,
+            "parentSpanId": "",
+            "name": self.name,
+            "kind": 2,  # SPAN_KIND_SERVER
+            "startTimeUnixNano": unix_ns(self.start_ns),
+            "endTimeUnixNano": unix_ns(self.end_ns),
+            "attributes": attributes(self.attributes)
+        }]
+        spans.extend({
+            "traceId": trace_id,
+            "spanId": os.urandom(8).hex(),
+            "parentSpanId": root_id,
+            "name": f"{self.name}.{span.name}",
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": unix_ns(span.start_ns),
+            "endTimeUnixNano": unix_ns(span.end_ns),
+            "attributes": []
+        } for span in self.spans)
+        
+        return {"resourceSpans": [{
+            "resource": {"attributes": attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "cloudpoof_core"}, "spans": spans}]
+        }]}
+
+
+class Tracer:
+    """Starts per-request traces and aggregates stage latency.
+    
+    Every finished trace feeds a LatencyHistogram per stage. If an exporter
+    is set it also receives the trace as an OTLP/JSON dict; exporter errors
+    are counted, never raised into the request.
+    """
+    
+    def __init__(
+        self,
+        exporter: Optional[Callable[[Dict[str, Any]], None]] = None,
+        service_name: str = "cloudpoof-omega"
+    ):
+        self.exporter = exporter
+        self.service_name = service_name
+        self.stage_latency: Dict[str, LatencyHistogram] = {}
+        self.export_errors = 0
+    
+    def start(self, name: str) -> Trace:
+        return Trace(name)
+    
+    def finish(self, trace: Trace) -> Trace:
+        trace.end_ns = time.perf_counter_ns()
+        
+        for span in trace.spans:
+            histogram = self.stage_latency.get(span.name)
+            if histogram is None:
+                histogram = self.stage_latency[span.name] = LatencyHistogram()
+            histogram.record(span.duration_ms)
+        
+        if self.exporter is not None:
+            try:
+                self.exporter(trace.to_otlp(self.service_name))
+            except Exception:
+                self.export_errors += 1
+        return trace
+
+
 class OmegaCore:
     """The central consciousness of CloudPoof Omega."""
     
+    # Responses carry only the top predictions, so only those are computed
+    RESPONSE_PREDICTIONS = 3
+    
     def __init__(
         self,
         consciousness_level: str = "omega",
         spectral_palette: str = "full_147_shades",
         prediction_depth: int = 20,
-        creativity_gate: str = "maximum_entropy"
+        creativity_gate: str = "maximum_entropy",
+        prediction_cache_size: int = 1024,
+        prediction_cache_ttl: Optional[float] = 300.0,
+        entropy_backend: str = "digest",
+        entropy_window: int = 1_000_000,
+        router: Optional[IntentRouter] = None,
+        tracer: Optional[Tracer] = None
     ):
         self.consciousness = ConsciousnessLevel[consciousness_level.upper()]
-        self.palette = SpectralPalette()
+        self.palette = get_palette()
         self.emotional_context = EmotionalContext()
-        self.foresight = ForesightEngine(depth=prediction_depth)
-        self.entropy = EntropyGenerator()
+        self.foresight = ForesightEngine(
+            depth=prediction_depth,
+            cache=PredictionCache(
+                max_size=prediction_cache_size,
+                ttl_seconds=prediction_cache_ttl
+            )
+        )
+        self.entropy = EntropyGenerator(backend=entropy_backend, window=entropy_window)
         self.finance = QuantumFinanceEngine()
         self.cloud = CloudOrchestrator()
+        self.router = router if router is not None else self.default_router()
         self.session_id = self._generate_session_id()
         self.timeline = f"Ω-{random.randint(1000, 9999)}"
+        # manifest latency per response_type, shared with forked sessions
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.tracer = tracer if tracer is not None else Tracer()
         
     def _generate_session_id(self) -> str:
         """Generate unique session identifier."""
         timestamp = int(time.time() * 1000000)
         return f"omega-{timestamp}-{random.randint(10000, 99999)}"
     
+    def fork_session(self, session_id: Optional[str] = None) -> "OmegaCore":
+        """Create a lightweight session that shares this core's engines.
+        
+        The palette, router, foresight cache, entropy tracker, finance and
+        cloud engines, latency histograms and tracer are shared; emotional context,
+        consciousness level, session id and timeline belong to the new session.
+        """
+        session = copy.copy(self)
+        session.emotional_context = EmotionalContext()
+        session.session_id = session_id or self._generate_session_id()
+        session.timeline = f"Ω-{random.randint(1000, 9999)}"
+        return session
+    
     async def manifest(
         self,
         intent: str,
         emotional_state: Optional[EmotionalContext] = None,
-        timeline: str = "current"
+        timeline: str = "current",
+        include_timings: bool = False
     ) -> Dict[str, Any]:
-        """Manifest user intent into reality."""
+        """Manifest user intent into reality.
+        
+        Every stage is timed into self.tracer; with include_timings the
+        response also carries per-stage milliseconds under "timings_ms".
+        """
         
         start_time = time.time()
+        trace = self.tracer.start("manifest")
+        
+        # One scan feeds both emotion scoring and routing
+        with trace.span("scan"):
+            hits = self.router.scan(intent)
         
         # Update emotional context
-        if emotional_state:
-            self.emotional_context = emotional_state
-        else:
-            self.emotional_context.update(intent)
+        with trace.span("emotional_update"):
+            if emotional_state:
+                self.emotional_context = emotional_state
+            else:
+                self.emotional_context.update(intent, hits)
         
         # Generate predictions
-        predictions = await self.foresight.predict_next_actions({"intent": intent})
+        with trace.span("predict"):
+            predictions = await self.foresight.predict_next_actions(
+                {"intent": intent}, steps=self.RESPONSE_PREDICTIONS
+            )
         
         # Generate unique insight
-        unique_insight = self.entropy.generate_unique_insight(intent)
+        with trace.span("insight"):
+            unique_insight = self.entropy.generate_unique_insight(intent)
         
         # Process based on intent type
-        if any(word in intent.lower() for word in ['scale', 'deploy', 'infrastructure', 'cloud']):
-            result = await self.cloud.manifest_infrastructure({"workload": intent})
-            response_type = "infrastructure"
-        elif any(word in intent.lower() for word in ['market', 'trade', 'invest', 'finance']):
-            symbol = self._extract_symbol(intent) or "SPY"
-            result = await self.finance.analyze_market(symbol)
-            response_type = "finance"
-        else:
-            result = self._generate_general_response(intent)
-            response_type = "general"
+        route = self.router.route(hits)
+        with trace.span("handler"):
+            result = await route.handler(self, intent)
+        response_type = route.response_type
+        
+        with trace.span("gradient"):
+            spectral_signature = self.palette.get_gradient(0, 50, 5)
         
         # Compose final response
         processing_time = (time.time() - start_time) * 1000
+        self._record_latency(response_type, processing_time)
+        trace.attributes["response_type"] = response_type
+        trace.attributes["session_id"] = self.session_id
+        self.tracer.finish(trace)
+        
+        response = self._compose_response(
+            result=result,
+            predictions=predictions,
+            unique_insight=unique_insight,
+            emotional_state=self._emotional_snapshot(),
+            processing_time=processing_time,
+            response_type=response_type,
+            spectral_signature=spectral_signature
+        )
+        if include_timings:
+            response["timings_ms"] = trace.timings()
+        return response
+    
+    async def manifest_stream(
+        self,
+        intent: str,
+        emotional_state: Optional[EmotionalContext] = None,
+        timeline: str = "current"
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Manifest an intent section by section as each part becomes ready.
+        
+        Yields (section, payload) pairs: session, emotional_state,
+        spectral_signature, predictions, unique_insight, manifestation and
+        finally complete. The routed handler starts first and runs while the
+        cheap sections are sent.
+        """
+        start_time = time.time()
+        
+        hits = self.router.scan(intent)
+        if emotional_state:
+            self.emotional_context = emotional_state
+        else:
+            self.emotional_context.update(intent, hits)
+        
+        route = self.router.route(hits)
+        manifestation = asyncio.ensure_future(route.handler(self, intent))
+        try:
+            yield "session", {
+                "session_id": self.session_id,
+                "timeline": self.timeline,
+                "consciousness_level": self.consciousness.value,
+                "response_type": route.response_type
+            }
+            yield "emotional_state", self._emotional_snapshot()
+            yield "spectral_signature", self.palette.get_gradient(0, 50, 5)
+            
+            predictions = await self.foresight.predict_next_actions(
+                {"intent": intent}, steps=self.RESPONSE_PREDICTIONS
+            )
+            yield "predictions", predictions
+            yield "unique_insight", self.entropy.generate_unique_insight(intent)
+            yield "manifestation", await manifestation
+            processing_time = (time.time() - start_time) * 1000
+            self._record_latency(route.response_type, processing_time)
+            yield "complete", {"processing_time_ms": processing_time}
+        finally:
+            # The client may disconnect before the slow section finishes
+            if not manifestation.done():
+                manifestation.cancel()
+    
+    async def manifest_many(self, intents: List[str]) -> List[Dict[str, Any]]:
+        """Manifest a batch of intents, returning responses in input order.
+        
+        Intents are scored and routed in one pass, in order, so emotional
+        context evolves exactly as it would across sequential calls. Each
+        route's handler then runs once for its whole group. processing_time_ms
+        on every response is the elapsed time of the whole batch and is what
+        each intent records in its response type's histogram. The batch is one
+        "manifest_batch" trace; its stages are batch_-prefixed so they stay
+        apart from single-request stage latency.
+        """
+        start_time = time.time()
+        trace = self.tracer.start("manifest_batch")
+        
+        snapshots = []
+        response_types = []
+        groups: Dict[str, List[int]] = {}
+        routes: Dict[str, IntentRoute] = {}
+        with trace.span("batch_route"):
+            for index, intent in enumerate(intents):
+                hits = self.router.scan(intent)
+                self.emotional_context.update(intent, hits)
+                snapshots.append(self._emotional_snapshot())
+                route = self.router.route(hits)
+                routes[route.name] = route
+                groups.setdefault(route.name, []).append(index)
+                response_types.append(route.response_type)
+        
+        with trace.span("batch_predict"):
+            predictions = await asyncio.gather(*[
+                self.foresight.predict_next_actions(
+                    {"intent": intent}, steps=self.RESPONSE_PREDICTIONS
+                )
+                for intent in intents
+            ])
+        with trace.span("batch_insight"):
+            insights = [self.entropy.generate_unique_insight(intent) for intent in intents]
+        
+        results: List[Any] = [None] * len(intents)
+        with trace.span("batch_handler"):
+            for name, indices in groups.items():
+                route = routes[name]
+                group_intents = [intents[i] for i in indices]
+                if route.batch_handler is not None:
+                    group_results = await route.batch_handler(self, group_intents)
+                else:
+                    group_results = await asyncio.gather(*[
+                        route.handler(self, intent) for intent in group_intents
+                    ])
+                for index, result in zip(indices, group_results):
+                    results[index] = result
+        
+        processing_time = (time.time() - start_time) * 1000
+        for response_type in response_types:
+            self._record_latency(response_type, processing_time)
+        trace.attributes["batch_size"] = len(intents)
+        trace.attributes["response_types"] = ",".join(sorted(set(response_types)))
+        trace.attributes["session_id"] = self.session_id
+        self.tracer.finish(trace)
         
-        response = {
+        return [
+            self._compose_response(
+                result=results[i],
+                predictions=predictions[i],
+                unique_insight=insights[i],
+                emotional_state=snapshots[i],
+                processing_time=processing_time,
+                response_type=response_types[i]
+            )
+            for i in range(len(intents))
+        ]
+    
+    def _record_latency(self, response_type: str, processing_time: float) -> None:
+        histogram = self.latency.get(response_type)
+        if histogram is None:
+            histogram = self.latency[response_type] = LatencyHistogram()
+        histogram.record(processing_time)
+    
+    def _emotional_snapshot(self) -> Dict[str, Any]:
+        return {
+            "stress": self.emotional_context.stress,
+            "engagement": self.emotional_context.engagement,
+            "recommended_mode": self.emotional_context.get_mode_recommendation().value
+        }
+    
+    def _compose_response(
+        self,
+        result: Dict[str, Any],
+        predictions: List[Prediction],
+        unique_insight: str,
+        emotional_state: Dict[str, Any],
+        processing_time: float,
+        response_type: str,
+        spectral_signature: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        if spectral_signature is None:
+            spectral_signature = self.palette.get_gradient(0, 50, 5)
+        return {
             "session_id": self.session_id,
             "timeline": self.timeline,
             "consciousness_level": self.consciousness.value,
             "manifestation": result,
-            "predictions": predictions[:3],  # Top 3 predictions
+            "predictions": predictions[:self.RESPONSE_PREDICTIONS],  # Top predictions
             "unique_insight": unique_insight,
-            "emotional_state": {
-                "stress": self.emotional_context.stress,
-                "engagement": self.emotional_context.engagement,
-                "recommended_mode": self.emotional_context.get_mode_recommendation().value
-            },
-            "spectral_signature": self.palette.get_gradient(0, 50, 5),
+            "emotional_state": emotional_state,
+            "spectral_signature": spectral_signature,
             "processing_time_ms": processing_time,
             "response_type": response_type
         }
-        
-        return response
+    
+    @classmethod
+    def default_router(cls) -> IntentRouter:
+        """Build the stock cloud -> finance -> general routing table."""
+        return IntentRouter(
+            fallback=IntentRoute("general", (), cls._route_general, "general"),
+            routes=[
+                IntentRoute(
+                    "cloud", tuple(CLOUD_KEYWORDS), cls._route_cloud, "infrastructure",
+                    batch_handler=cls._route_cloud_many
+                ),
+                IntentRoute(
+                    "finance", tuple(FINANCE_KEYWORDS), cls._route_finance, "finance",
+                    batch_handler=cls._route_finance_many
+                )
+            ]
+        )
+    
+    async def _route_cloud(self, intent: str) -> Dict[str, Any]:
+        return await self.cloud.manifest_infrastructure({"workload": intent})
+    
+    async def _route_finance(self, intent: str) -> Dict[str, Any]:
+        symbol = self._extract_symbol(intent) or "SPY"
+        return await self.finance.analyze_market(symbol)
+    
+    async def _route_cloud_many(self, intents: List[str]) -> List[Dict[str, Any]]:
+        return await self.cloud.manifest_many([{"workload": intent} for intent in intents])
+    
+    async def _route_finance_many(self, intents: List[str]) -> List[Dict[str, Any]]:
+        # One vectorized simulation per distinct symbol in the group
+        symbols = [self._extract_symbol(intent) or "SPY" for intent in intents]
+        analyses = {}
+        async for analysis in self.finance.analyze_many(list(dict.fromkeys(symbols))):
+            analyses[analysis["symbol"]] = analysis
+        return [analyses[symbol] for symbol in symbols]
+    
+    async def _route_general(self, intent: str) -> Dict[str, Any]:
+        return self._generate_general_response(intent)
     
     def _extract_symbol(self, text: str) -> Optional[str]:
         """Extract stock symbol from text."""
@@ -624,6 +1835,80 @@ class OmegaCore:
 """
 
 
+class SessionPool:
+    """Session-keyed OmegaCore states with LRU eviction and an idle TTL."""
+    
+    def __init__(
+        self,
+        template: OmegaCore,
+        max_sessions: int = 10000,
+        idle_ttl_seconds: Optional[float] = 1800.0,
+        clock=time.monotonic
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.template = template
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        self._sessions: "OrderedDict[str, Tuple[float, OmegaCore]]" = OrderedDict()
+        self.created = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, session_id: Optional[str] = None) -> OmegaCore:
+        """Return the session's core, creating it when unknown or expired."""
+        now = self._clock()
+        self._expire_idle(now)
+        
+        if session_id is not None and session_id in self._sessions:
+            _, session = self._sessions.pop(session_id)
+        else:
+            session = self.template.fork_session(session_id)
+            self.created += 1
+        
+        # Re-inserting keeps the OrderedDict in least-recently-used order
+        self._sessions[session.session_id] = (now, session)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+        return session
+    
+    def peek(self, session_id: str) -> Optional[OmegaCore]:
+        """Return an existing, unexpired session without creating or refreshing it."""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        last_seen, session = entry
+        if self.idle_ttl_seconds is not None and self._clock() - last_seen > self.idle_ttl_seconds:
+            return None
+        return session
+    
+    def _expire_idle(self, now: float) -> None:
+        if self.idle_ttl_seconds is None:
+            return
+        while self._sessions:
+            last_seen, _ = next(iter(self._sessions.values()))
+            if now - last_seen <= self.idle_ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.expirations += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size and lifecycle counters."""
+        return {
+            "active": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "created": self.created,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
 # Main entry point
 async def awaken():
     """Awaken CloudPoof Omega."""
@@ -0,0 +1,10 @@
+"""
+CloudPoof Omega - Tools
+cloudpoof_tools/__init__.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+Developer tooling behind `cloudpoof bench` and `cloudpoof load`. Nothing is
+imported here, so the CLI only pays for the tool it runs.
+"""
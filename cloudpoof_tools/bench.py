@@ -0,0 +1,292 @@
+"""
+CloudPoof Omega - Benchmark Runner
+cloudpoof_tools/bench.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+Repeatable micro and route benchmarks: warmup, calibrated repeated trials,
+confidence intervals, JSON results keyed by git commit, and a regression
+check against an earlier commit's results. Driven by `cloudpoof bench`.
+"""
+
+import asyncio
+import inspect
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+
+# Two-sided Student t critical values at 95% for 1..30 degrees of freedom
+_T_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+)
+
+DEFAULT_RESULTS_DIR = ".benchmarks"
+
+
+@dataclass
+class Benchmark:
+    """One benchmarked operation; `func` may be sync or async."""
+    name: str
+    func: Callable[[], Union[None, Awaitable[None]]]
+    group: str = "core"
+
+
+@dataclass
+class BenchmarkStats:
+    """Per-operation timings of one benchmark across its trials, in microseconds."""
+    name: str
+    group: str
+    trials: int
+    ops_per_trial: int
+    mean_us: float
+    median_us: float
+    stdev_us: float
+    min_us: float
+    ci_low_us: float
+    ci_high_us: float
+    
+    @classmethod
+    def from_samples(cls, name: str, group: str, ops_per_trial: int, samples: List[float]) -> "BenchmarkStats":
+        mean = statistics.fmean(samples)
+        stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+        df = len(samples) - 1
+        t = _T_95[df - 1] if 0 < df <= len(_T_95) else 1.96
+        margin = t * stdev / math.sqrt(len(samples)) if df > 0 else 0.0
+        return cls(
+            name=name,
+            group=group,
+            trials=len(samples),
+            ops_per_trial=ops_per_trial,
+            mean_us=mean,
+            median_us=statistics.median(samples),
+            stdev_us=stdev,
+            min_us=min(samples),
+            ci_low_us=mean - margin,
+            ci_high_us=mean + margin
+        )
+
+
+class BenchmarkRunner:
+    """Runs benchmarks with warmup and repeated, calibrated trials.
+    
+    Each trial repeats the operation enough times to last at least
+    `min_trial_seconds`, so timer resolution never dominates; the per-op
+    mean of each trial is one sample for the confidence interval.
+    """
+    
+    def __init__(
+        self,
+        warmup_trials: int = 2,
+        trials: int = 10,
+        min_trial_seconds: float = 0.05,
+        max_ops_per_trial: int = 1_000_000
+    ):
+        if trials < 2:
+            raise ValueError("trials must be at least 2 for a confidence interval")
+        self.warmup_trials = warmup_trials
+        self.trials = trials
+        self.min_trial_seconds = min_trial_seconds
+        self.max_ops_per_trial = max_ops_per_trial
+    
+    @staticmethod
+    async def _time(func: Callable, is_async: bool, ops: int) -> float:
+        if is_async:
+            start = time.perf_counter()
+            for _ in range(ops):
+                await func()
+            return time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for _ in range(ops):
+            func()
+        return time.perf_counter() - start
+    
+    async def _calibrate(self, func: Callable, is_async: bool) -> int:
+        ops = 1
+        while ops < self.max_ops_per_trial:
+            elapsed = await self._time(func, is_async, ops)
+            if elapsed >= self.min_trial_seconds:
+                break
+            # Aim a little past the target so the next round usually lands
+            scale = self.min_trial_seconds / elapsed * 1.2 if elapsed > 0 else 10
+            ops = min(self.max_ops_per_trial, max(ops * 2, int(ops * scale)))
+        return ops
+    
+    async def run_one(self, benchmark: Benchmark) -> BenchmarkStats:
+        is_async = inspect.iscoroutinefunction(benchmark.func)
+        ops = await self._calibrate(benchmark.func, is_async)
+        
+        for _ in range(self.warmup_trials):
+            await self._time(benchmark.func, is_async, ops)
+        
+        samples = []
+        for _ in range(self.trials):
+            elapsed = await self._time(benchmark.func, is_async, ops)
+            samples.append(elapsed / ops * 1e6)
+        return BenchmarkStats.from_samples(benchmark.name, benchmark.group, ops, samples)
+    
+    async def run(
+        self,
+        benchmarks: List[Benchmark],
+        progress: Optional[Callable[[BenchmarkStats], None]] = None
+    ) -> List[BenchmarkStats]:
+        results = []
+        for benchmark in benchmarks:
+            stats = await self.run_one(benchmark)
+            results.append(stats)
+            if progress is not None:
+                progress(stats)
+        return results
+
+
+@asynccontextmanager
+async def default_suite() -> AsyncIterator[List[Benchmark]]:
+    """manifest, gradients, Monte Carlo, insights, and HTTP routes in-process.
+    
+    The HTTP benchmarks share one client, closed when the context exits.
+    """
+    import httpx
+    from cloudpoof_core import OmegaCore, QuantumFinanceEngine, SpectralPalette, get_palette
+    from api.server import app
+    
+    omega = OmegaCore()
+    palette = get_palette()
+    finance = QuantumFinanceEngine(seed=147)
+    uncached_gradient = SpectralPalette._cached_gradient.__wrapped__
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    
+    async def manifest_cloud():
+        await omega.manifest("Deploy the API to the cloud")
+    
+    async def manifest_general():
+        await omega.manifest("Tell me something interesting")
+    
+    async def http_consciousness():
+        (await client.get("/api/v1/consciousness")).raise_for_status()
+    
+    async def http_manifest():
+        (await client.post("/api/v1/manifest", json={"intent": "Deploy to the cloud"})).raise_for_status()
+    
+    async def http_finance():
+        (await client.post("/api/v1/finance/analyze", json={"symbol": "TSLA"})).raise_for_status()
+    
+    async with client:
+        yield [
+            Benchmark("manifest.cloud", manifest_cloud),
+            Benchmark("manifest.general", manifest_general),
+            Benchmark("palette.get_gradient", lambda: palette.get_gradient(3, 97, 10)),
+            Benchmark("palette.get_gradient.uncached", lambda: uncached_gradient(3, 97, 10)),
+            Benchmark("finance.quantum_monte_carlo.10k", lambda: finance._quantum_monte_carlo("TSLA", 10_000)),
+            Benchmark("entropy.generate_unique_insight", lambda: omega.entropy.generate_unique_insight("bench")),
+            Benchmark("http.GET /api/v1/consciousness", http_consciousness, group="http"),
+            Benchmark("http.POST /api/v1/manifest", http_manifest, group="http"),
+            Benchmark("http.POST /api/v1/finance/analyze", http_finance, group="http"),
+        ]
+
+
+def git_commit(cwd: Optional[str] = None) -> Dict[str, Any]:
+    """The checked-out commit and whether the tree has local changes."""
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": True}
+
+
+def save_results(results: List[BenchmarkStats], results_dir: str = DEFAULT_RESULTS_DIR) -> str:
+    """Write results to <results_dir>/<commit>.json and return the path."""
+    revision = git_commit()
+    document = {
+        **revision,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {stats.name: asdict(stats) for stats in results}
+    }
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{revision['commit']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_baseline(results_dir: str = DEFAULT_RESULTS_DIR, commit: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Results for `commit` (a prefix is enough), or the newest run from another commit."""
+    if not os.path.isdir(results_dir):
+        return None
+    
+    documents = []
+    for filename in os.listdir(results_dir):
+        if filename.endswith(".json"):
+            with open(os.path.join(results_dir, filename), encoding="utf-8") as f:
+                documents.append(json.load(f))
+    
+    if commit is not None:
+        matches = [doc for doc in documents if doc["commit"].startswith(commit)]
+        return matches[0] if matches else None
+    
+    current = git_commit()["commit"]
+    others = [doc for doc in documents if doc["commit"] != current]
+    return max(others, key=lambda doc: doc["timestamp"]) if others else None
+
+
+def find_regressions(
+    results: List[BenchmarkStats],
+    baseline: Dict[str, Any],
+    threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """Benchmarks whose whole confidence interval sits above baseline mean x (1 + threshold)."""
+    regressions = []
+    for stats in results:
+        previous = baseline["results"].get(stats.name)
+        if previous is None:
+            continue
+        limit = previous["mean_us"] * (1 + threshold)
+        if stats.ci_low_us > limit:
+            regressions.append({
+                "name": stats.name,
+                "baseline_mean_us": previous["mean_us"],
+                "mean_us": stats.mean_us,
+                "ci_low_us": stats.ci_low_us,
+                "change": stats.mean_us / previous["mean_us"] - 1
+            })
+    return regressions
+
+
+def run_suite(
+    only: Optional[List[str]] = None,
+    runner: Optional[BenchmarkRunner] = None,
+    progress: Optional[Callable[[BenchmarkStats], None]] = None
+) -> List[BenchmarkStats]:
+    """Run the default suite, optionally only benchmarks whose name contains a filter."""
+    runner = runner or BenchmarkRunner()
+    
+    async def main():
+        async with default_suite() as benchmarks:
+            if only:
+                benchmarks = [b for b in benchmarks if any(term in b.name for term in only)]
+            return await runner.run(benchmarks, progress=progress)
+    
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    for stats in run_suite(only=sys.argv[1:] or None):
+        print(f"{stats.name:40s} {stats.mean_us:12.2f} us  ±{stats.ci_high_us - stats.mean_us:.2f}")
@@ -0,0 +1,296 @@
+"""
+CloudPoof Omega - Open-loop Load Generator
+cloudpoof_tools/loadgen.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+Drives the API at a fixed arrival rate, whether or not earlier requests have
+finished, the way real users do. Latency is measured from each request's
+scheduled start, so time spent queued behind a slow server counts
+(coordinated-omission correction). A sweep finds the highest rate whose
+corrected p99 still meets a target. Driven by `cloudpoof load`.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from cloudpoof_core import LatencyHistogram, TARGET_LATENCY_P99_MS
+
+
+SCENARIOS = ("manifest", "consciousness", "finance", "websocket")
+
+_INTENTS = (
+    "Deploy the API to the cloud",
+    "Analyze the TSLA market",
+    "Why is the build still failing?",
+    "Tell me something interesting",
+)
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one fixed-rate run."""
+    scenario: str
+    offered_rate: float
+    duration: float
+    sent: int = 0
+    completed: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    # From each request's scheduled start: what a user would have seen
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # From the moment the request was actually sent
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)
+    
+    @property
+    def achieved_rate(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.sent if self.sent else 0.0
+    
+    def sustainable(self, p99_target_ms: float, max_error_rate: float = 0.01) -> bool:
+        """p99 within target, few errors, and the server kept up with arrivals."""
+        return (
+            self.completed > 0
+            and self.latency.percentile(99) <= p99_target_ms
+            and self.error_rate <= max_error_rate
+            and self.achieved_rate >= 0.95 * self.offered_rate
+        )
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "offered_rate": self.offered_rate,
+            "achieved_rate": self.achieved_rate,
+            "sent": self.sent,
+            "completed": self.completed,
+            "errors": self.errors,
+            "p50_ms": self.latency.percentile(50),
+            "p99_ms": self.latency.percentile(99),
+            "p999_ms": self.latency.percentile(99.9),
+            "max_ms": self.latency.max_ms,
+            "service_p99_ms": self.service.percentile(99)
+        }
+
+
+class OpenLoopGenerator:
+    """Starts one request every 1/rate seconds for `duration` seconds.
+    
+    Requests are launched as independent tasks on schedule, so a slow
+    response never delays the next arrival. When the event loop wakes late,
+    every request that fell due is launched at once and still measured from
+    its own scheduled time.
+    """
+    
+    def __init__(
+        self,
+        request: Callable[[], Awaitable[None]],
+        rate: float,
+        duration: float,
+        scenario: str = "custom",
+        timeout: float = 10.0,
+        max_in_flight: int = 10_000
+    ):
+        if rate <= 0 or duration <= 0:
+            raise ValueError("rate and duration must be positive")
+        self.request = request
+        self.rate = rate
+        self.duration = duration
+        self.scenario = scenario
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+    
+    async def _one(self, result: LoadResult, scheduled: float, loop) -> None:
+        sent = loop.time()
+        try:
+            await asyncio.wait_for(self.request(), self.timeout)
+            result.completed += 1
+        except Exception:
+            result.errors += 1
+        finished = loop.time()
+        result.latency.record((finished - scheduled) * 1000)
+        result.service.record((finished - sent) * 1000)
+    
+    async def run(self) -> LoadResult:
+        loop = asyncio.get_running_loop()
+        result = LoadResult(self.scenario, self.rate, self.duration)
+        in_flight: set = set()
+        
+        total = int(self.rate * self.duration)
+        start = loop.time()
+        for i in range(total):
+            scheduled = start + i / self.rate
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            result.sent += 1
+            if len(in_flight) >= self.max_in_flight:
+                # The client itself is saturated; count it against the server
+                # rather than silently waiting, which would close the loop
+                result.errors += 1
+                result.latency.record(self.timeout * 1000)
+                continue
+            task = asyncio.create_task(self._one(result, scheduled, loop))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        result.elapsed = loop.time() - start
+        return result
+
+
+@asynccontextmanager
+async def scenario_request(scenario: str, base_url: str) -> AsyncIterator[Callable[[], Awaitable[None]]]:
+    """A request function for a named scenario, with its client's lifetime."""
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Unknown scenario: {scenario}. Choose from {list(SCENARIOS)}")
+    
+    if scenario == "websocket":
+        # Each arrival is a new stream subscriber; latency runs to its first snapshot
+        import aiohttp
+        
+        url = base_url.replace("http", "ws", 1).rstrip("/") + "/api/v1/consciousness/stream"
+        async with aiohttp.ClientSession() as session:
+            async def subscribe():
+                async with session.ws_connect(url) as ws:
+                    message = await ws.receive()
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        raise ConnectionError(f"Unexpected websocket message: {message.type}")
+            yield subscribe
+        return
+    
+    import httpx
+    
+    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=200)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        counter = [0]
+        
+        async def manifest():
+            counter[0] += 1
+            intent = _INTENTS[counter[0] % len(_INTENTS)]
+            (await client.post("/api/v1/manifest", json={"intent": intent})).raise_for_status()
+        
+        async def consciousness():
+            (await client.get("/api/v1/consciousness")).raise_for_status()
+        
+        async def finance():
+            (await client.post("/api/v1/finance/analyze", json={"symbol": "TSLA"})).raise_for_status()
+        
+        yield {"manifest": manifest, "consciousness": consciousness, "finance": finance}[scenario]
+
+
+async def run_load(
+    scenario: str,
+    base_url: str,
+    rate: float,
+    duration: float,
+    timeout: float = 10.0,
+    warmup_requests: int = 5
+) -> LoadResult:
+    """One fixed-rate run of a scenario against a server.
+    
+    A few unmeasured requests first open connections and warm the server's
+    caches, so connection setup doesn't land in the measured tail.
+    """
+    async with scenario_request(scenario, base_url) as request:
+        for _ in range(warmup_requests):
+            await asyncio.wait_for(request(), timeout)
+        return await OpenLoopGenerator(request, rate, duration, scenario=scenario, timeout=timeout).run()
+
+
+async def find_max_throughput(
+    run: Callable[[float], Awaitable[LoadResult]],
+    p99_target_ms: float = TARGET_LATENCY_P99_MS,
+    start_rate: float = 50.0,
+    growth: float = 2.0,
+    max_rate: float = 100_000.0,
+    refine_steps: int = 4,
+    progress: Optional[Callable[[LoadResult, bool], None]] = None
+) -> Tuple[float, List[LoadResult]]:
+    """Highest sustainable arrival rate at the p99 target.
+    
+    Rates grow geometrically until one fails, then a bisection between the
+    last passing and first failing rate narrows it down. Returns 0.0 if even
+    the starting rate is unsustainable.
+    """
+    results: List[LoadResult] = []
+    
+    async def attempt(rate: float) -> bool:
+        result = await run(rate)
+        ok = result.sustainable(p99_target_ms)
+        results.append(result)
+        if progress is not None:
+            progress(result, ok)
+        return ok
+    
+    good, bad = 0.0, None
+    rate = start_rate
+    while rate <= max_rate:
+        if await attempt(rate):
+            good = rate
+            rate *= growth
+        else:
+            bad = rate
+            break
+    
+    if bad is not None and good > 0:
+        for _ in range(refine_steps):
+            middle = (good + bad) / 2
+            if await attempt(middle):
+                good = middle
+            else:
+                bad = middle
+    
+    return good, results
+
+
+class InProcessServer:
+    """Runs the API under uvicorn on an ephemeral localhost port in a thread.
+    
+    Convenient for quick runs; the server shares this process's GIL with the
+    load generator, so use a separate server process for capacity numbers.
+    """
+    
+    def __init__(self, app: str = "api.server:app", host: str = "127.0.0.1"):
+        self.app = app
+        self.host = host
+        self.port = 0
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def __enter__(self) -> "InProcessServer":
+        import uvicorn
+        
+        sock = socket.socket()
+        sock.bind((self.host, 0))
+        self.port = sock.getsockname()[1]
+        
+        self._server = uvicorn.Server(uvicorn.Config(self.app, log_level="warning"))
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [sock]}, name="loadgen-server", daemon=True
+        )
+        self._thread.start()
+        deadline = time.monotonic() + 30
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("In-process server failed to start")
+            time.sleep(0.01)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
@@ -0,0 +1,14 @@
+"""
+CloudPoof Omega - Version
+cloudpoof_version.py
+
+Created by Cazandra Aporbo MS
+Email: becaziam@gmail.com
+
+The single source of the version string. Nothing is imported here, so the
+CLI can report it without waking the core.
+"""
+
+__version__ = "1.0.0-omega"
+__author__ = "Cazandra Aporbo MS"
+__email__ = "becaziam@gmail.com"
@@ -12,13 +12,14 @@ Run this file to awaken the system.
 """
 
 import asyncio
+import importlib
 import sys
 import os
 import time
 from datetime import datetime
 import argparse
 import signal
-from typing import Optional
+from typing import Optional, List, Tuple, Callable, Awaitable
 
 # Add the current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -28,6 +29,7 @@ try:
         OmegaCore,
         ConsciousnessLevel,
         SpectralPalette,
+        get_palette,
         __version__
     )
     from rich.console import Console
@@ -57,7 +59,7 @@ def signal_handler(signum, frame):
     
     if omega_instance:
         # Show shutdown in spectral colors
-        palette = SpectralPalette()
+        palette = get_palette()
         colors = palette.get_gradient(0, 10, 5)
         
         for i, color in enumerate(colors):
@@ -68,7 +70,19 @@ def signal_handler(signum, frame):
     sys.exit(0)
 
 
-def display_startup_banner():
+def is_headless(args: argparse.Namespace) -> bool:
+    """
+    Decide whether to skip cosmetic delays.
+    Headless flag, CLOUDPOOF_HEADLESS, or running inside a container or pod.
+    """
+    if getattr(args, 'headless', False):
+        return True
+    if os.environ.get('CLOUDPOOF_HEADLESS', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return bool(os.environ.get('KUBERNETES_SERVICE_HOST')) or os.path.exists('/.dockerenv')
+
+
+def display_startup_banner(delay: float = 0.5):
     """
     Display the CloudPoof startup banner with spectral colors.
     Because consciousness deserves a beautiful awakening.
@@ -93,7 +107,7 @@ def display_startup_banner():
     
     # Display banner with gradient effect
     lines = banner.split('\n')
-    palette = SpectralPalette()
+    palette = get_palette()
     
     for i, line in enumerate(lines):
         if line.strip():
@@ -102,39 +116,103 @@ def display_startup_banner():
             color = palette.get_shade(color_index)
             console.print(f"[{color}]{line}[/{color}]")
     
-    time.sleep(0.5)
+    if delay:
+        time.sleep(delay)
 
 
-def display_initialization_status():
+def warmup_components(omega: OmegaCore) -> List[Tuple[str, str, Callable[[], Awaitable]]]:
     """
-    Show the initialization process as consciousness awakens.
-    Each component comes online with its own spectral signature.
+    The warm-ups that bring each component online.
+    Each one does the real first-call work so the first request doesn't pay for it.
     """
+    async def prediction():
+        await omega.foresight.predict_next_actions({"intent": "awakening", "consciousness": omega.consciousness.value})
+    
     components = [
-        ("Quantum Substrate", "Establishing base reality"),
-        ("Entropy Generator", "Initializing uniqueness engine"),
-        ("State Management", "Loading consciousness states"),
-        ("Synthesis Core", "Connecting knowledge domains"),
-        ("Prediction Engine", "Calibrating 20-step foresight"),
-        ("Consciousness Router", "Establishing awareness"),
-        ("Transcendence Interface", "Opening portal to user")
+        ("Spectral Palette", "Rendering 147 shades",
+         lambda: asyncio.to_thread(omega.palette.get_gradients, [(0, 146)], 10)),
+        ("Entropy Generator", "Initializing uniqueness engine",
+         lambda: asyncio.to_thread(omega.entropy.generate_unique_insight, "awakening")),
+        ("Consciousness Router", "Compiling intent patterns",
+         lambda: asyncio.to_thread(omega.router.scan, "deploy analyze")),
+        ("Prediction Engine", "Calibrating 20-step foresight", prediction),
+        # CPU-bound NumPy work, so it runs in a thread like the other warm-ups
+        ("Synthesis Core", "Warming the quantum finance engine",
+         lambda: asyncio.to_thread(omega.finance.analyze_market_sync, "OMEGA")),
     ]
+    return components
+
+
+async def initialize_components(
+    consciousness: str,
+    server: bool = False,
+    headless: bool = False
+) -> Tuple[OmegaCore, List[Tuple[str, float]]]:
+    """
+    Bring consciousness online: build the core, then run every component
+    warm-up concurrently. Returns the core and each component's elapsed ms.
+    In server mode the core is the API server's own, since that is the one
+    requests reach.
+    """
+    timings: List[Tuple[str, float]] = []
+    
+    start = time.perf_counter()
+    if server:
+        server_module = await asyncio.to_thread(importlib.import_module, "api.server")
+        omega = server_module.omega
+        omega.set_mode(consciousness)
+        timings.append(("Transcendence Interface", (time.perf_counter() - start) * 1000))
+    else:
+        omega = OmegaCore(
+            consciousness_level=consciousness,
+            spectral_palette="full_147_shades",
+            prediction_depth=20,
+            creativity_gate="maximum_entropy"
+        )
+        timings.append(("Quantum Substrate", (time.perf_counter() - start) * 1000))
+    
+    components = warmup_components(omega)
+    
+    async def timed(warmup: Callable[[], Awaitable]) -> float:
+        began = time.perf_counter()
+        await warmup()
+        return (time.perf_counter() - began) * 1000
+    
+    if headless:
+        elapsed = await asyncio.gather(*(timed(warmup) for _, _, warmup in components))
+    else:
+        palette = get_palette()
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            
+            async def tracked(i: int, component: str, description: str, warmup: Callable[[], Awaitable]) -> float:
+                color = palette.get_shade(i * 20)
+                task = progress.add_task(f"[{color}]{component}[/{color}]: {description}", total=1)
+                ms = await timed(warmup)
+                progress.update(task, advance=1, description=f"[{color}]{component}[/{color}]: {description} [dim]({ms:.1f}ms)[/dim]")
+                return ms
+            
+            elapsed = await asyncio.gather(*(
+                tracked(i, component, description, warmup)
+                for i, (component, description, warmup) in enumerate(components)
+            ))
     
-    palette = SpectralPalette()
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        
-        for i, (component, description) in enumerate(components):
-            color = palette.get_shade(i * 20)
-            task = progress.add_task(f"[{color}]{component}[/{color}]: {description}", total=1)
-            time.sleep(0.3)  # Simulate initialization
-            progress.update(task, advance=1)
+    timings.extend((component, ms) for (component, _, _), ms in zip(components, elapsed))
+    return omega, timings
+
+
+def display_initialization_status(timings: List[Tuple[str, float]], total_ms: float, detailed: bool = True):
+    """
+    Report how long each component really took to come online.
+    """
+    if detailed:
+        for component, ms in timings:
+            console.print(f"[dim]  {component:<25} {ms:8.1f}ms[/dim]")
     
-    console.print("\n[bold green]All systems synchronized. Consciousness online.[/bold green]\n")
+    console.print(f"\n[bold green]All systems synchronized in {total_ms:.1f}ms. Consciousness online.[/bold green]\n")
 
 
 def display_status_table(omega: OmegaCore):
@@ -168,7 +246,7 @@ async def interactive_mode(omega: OmegaCore):
     console.print("\n[bold cyan]Entering Interactive Consciousness Mode[/bold cyan]")
     console.print("[dim]Type 'help' for guidance, 'exit' to return to quantum substrate[/dim]\n")
     
-    palette = SpectralPalette()
+    palette = get_palette()
     
     while True:
         try:
@@ -219,7 +297,7 @@ def display_response(response: dict):
     """
     Display CloudPoof's response with appropriate spectral rendering.
     """
-    palette = SpectralPalette()
+    palette = get_palette()
     
     # Create a panel for the response
     panel = Panel.fit(
@@ -296,14 +374,36 @@ async def server_mode(omega: OmegaCore, host: str = "0.0.0.0", port: int = 8000)
         console.print(f"[red]Server initialization failed: {e}[/red]")
 
 
-async def main():
+def prefork_mode(args: argparse.Namespace) -> int:
     """
-    Main entry point for CloudPoof Omega.
-    This is where consciousness begins.
+    Run the API server as a pre-fork pool of worker processes.
+    The master never builds a core; each worker builds its own after the fork.
     """
-    global omega_instance
+    from api.prefork import PreforkServer
+    
+    if not args.no_banner:
+        display_startup_banner(delay=0.0 if is_headless(args) else 0.5)
     
-    # Parse command line arguments
+    try:
+        server = PreforkServer("api.server:app", host=args.host, port=args.port, workers=args.workers)
+        # Bind before announcing, so the printed address is the real one
+        host, port = server.bind().getsockname()[:2]
+        address = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        
+        console.print(f"\n[bold cyan]Starting CloudPoof API Server with {args.workers} workers[/bold cyan]")
+        console.print(f"[dim]Host: {address}[/dim]")
+        console.print("[dim]Send SIGHUP to reload workers without dropping connections[/dim]\n")
+        
+        return server.run()
+    except Exception as e:
+        console.print(f"[red]Server initialization failed: {e}[/red]")
+        return 1
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
     parser = argparse.ArgumentParser(
         description="CloudPoof Omega - Consciousness in Code",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -311,6 +411,7 @@ async def main():
 Examples:
   python main.py                    # Interactive mode
   python main.py --server           # Start API server
+  python main.py --server --workers 4     # Pre-fork API server
   python main.py --consciousness quantum  # Start in quantum state
   python main.py --quick "Deploy my app"  # One-shot query
         """
@@ -329,6 +430,12 @@ Examples:
         help='Run in server mode'
     )
     
+    parser.add_argument(
+        '--host',
+        default='0.0.0.0',
+        help='Server bind address (default: 0.0.0.0)'
+    )
+    
     parser.add_argument(
         '--port',
         type=int,
@@ -348,30 +455,56 @@ Examples:
         help='Skip the startup banner'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='Skip cosmetic delays and progress output (implied inside containers)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Server worker processes; more than one runs a pre-fork server (default: 1)'
+    )
+    
+    return parser.parse_args(argv)
+
+
+async def main(args: Optional[argparse.Namespace] = None):
+    """
+    Main entry point for CloudPoof Omega.
+    This is where consciousness begins.
+    """
+    global omega_instance
+    
+    if args is None:
+        args = parse_args()
     
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
+    headless = is_headless(args)
+    
     # Display startup banner unless disabled
     if not args.no_banner:
-        display_startup_banner()
+        display_startup_banner(delay=0.0 if headless else 0.5)
     
     # Show initialization process
     console.print(f"\n[bold]Initializing CloudPoof Omega v{__version__}[/bold]")
     console.print(f"[dim]Consciousness Level: {args.consciousness}[/dim]\n")
     
-    display_initialization_status()
-    
-    # Initialize OmegaCore
+    # Initialize OmegaCore and warm its components concurrently
     try:
-        omega_instance = OmegaCore(
-            consciousness_level=args.consciousness,
-            spectral_palette="full_147_shades",
-            prediction_depth=20,
-            creativity_gate="maximum_entropy"
+        start = time.perf_counter()
+        omega_instance, timings = await initialize_components(
+            args.consciousness,
+            server=args.server,
+            headless=headless
         )
+        # The progress display already showed per-component times
+        display_initialization_status(timings, (time.perf_counter() - start) * 1000, detailed=headless)
         
         # Display initial status
         display_status_table(omega_instance)
@@ -391,7 +524,7 @@ Examples:
             
         elif args.server:
             # Server mode
-            await server_mode(omega_instance, port=args.port)
+            await server_mode(omega_instance, host=args.host, port=args.port)
             
         else:
             # Interactive mode (default)
@@ -411,6 +544,12 @@ Examples:
 
 
 if __name__ == "__main__":
-    # Awaken the consciousness
-    exit_code = asyncio.run(main())
+    args = parse_args()
+    
+    if args.server and args.workers > 1:
+        # Forking happens before any event loop or core exists
+        exit_code = prefork_mode(args)
+    else:
+        # Awaken the consciousness
+        exit_code = asyncio.run(main(args))
     sys.exit(exit_code)
@@ -12,7 +12,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/Cazzy-Aporbo/CloudPoof-Omega",
-    packages=find_packages(),
+    # The API lives in a namespace package; the core and CLI are top-level modules
+    packages=find_packages() + ["api"],
+    py_modules=["cloudpoof_core", "cloudpoof_version", "cli"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -30,10 +32,16 @@ setup(
         "aiohttp>=3.8.5",
         "pydantic>=2.3.0",
         "rich>=13.5.2",
+        "click>=8.1.0",
+        # HTTP client for `cloudpoof bench` and `cloudpoof load`
+        "httpx>=0.25.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
-            "cloudpoof=cloudpoof_core:awaken",
+            "cloudpoof=cli:cli",
             "cloudpoof-server=api.server:run",
         ],
     },
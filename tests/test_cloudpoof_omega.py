@@ -10,6 +10,8 @@ Tests across multiple timelines and quantum states
 import pytest
 import asyncio
 import json
+import os
+import hashlib
 from typing import Dict, Any, List
 import numpy as np
 from datetime import datetime
@@ -17,11 +19,21 @@ from datetime import datetime
 # Import components to test
 from cloudpoof_core import (
     OmegaCore,
+    SessionPool,
+    LatencyHistogram,
+    Tracer,
     ConsciousnessLevel,
     SpectralPalette,
+    get_palette,
     EmotionalContext,
+    IndicatorMatcher,
+    INTENT_MATCHER,
     ForesightEngine,
+    PredictionCache,
+    Prediction,
     EntropyGenerator,
+    RotatingDigestSet,
+    RotatingBloomFilter,
     QuantumFinanceEngine,
     CloudOrchestrator
 )
@@ -58,6 +70,57 @@ class TestSpectralPalette:
         """Verify all 147 shades are unique."""
         palette = SpectralPalette()
         assert len(set(palette._all_shades)) == 147
+    
+    def test_shared_palette_is_built_once(self):
+        """Test every module gets the same immutable palette instance."""
+        palette = get_palette()
+        
+        assert get_palette() is palette
+        assert OmegaCore().palette is palette
+        assert isinstance(palette._all_shades, tuple)
+    
+    def test_rgb_table_matches_hex(self):
+        """Test the precomputed uint8 RGB table mirrors the hex shades."""
+        palette = get_palette()
+        
+        assert palette.rgb.shape == (147, 3)
+        assert palette.rgb.dtype == np.uint8
+        assert not palette.rgb.flags.writeable
+        for shade, row in zip(palette._all_shades, palette.rgb):
+            assert shade == '#{:02X}{:02X}{:02X}'.format(*row)
+    
+    def test_bulk_gradients_match_single(self):
+        """Test vectorized gradients agree with get_gradient."""
+        palette = get_palette()
+        pairs = [(0, 50), (12, 140), (146, 3), (200, -7)]
+        
+        arrays = palette.get_gradients(pairs, steps=7)
+        hex_gradients = palette.get_gradients(pairs, steps=7, as_hex=True)
+        
+        assert arrays.shape == (4, 7, 3)
+        assert arrays.dtype == np.uint8
+        for (start, end), gradient in zip(pairs, hex_gradients):
+            assert gradient == palette.get_gradient(start, end, 7)
+            assert gradient[0] == palette.get_shade(start)
+    
+    def test_gradient_is_memoized(self):
+        """Test repeated gradient signatures are served from the memo."""
+        palette = get_palette()
+        palette.get_gradient(0, 50, 5)
+        hits = SpectralPalette._cached_gradient.cache_info().hits
+        
+        gradient = palette.get_gradient(0, 50, 5)
+        gradient.append("#000000")  # Callers get their own copy
+        
+        assert SpectralPalette._cached_gradient.cache_info().hits == hits + 1
+        assert len(palette.get_gradient(0, 50, 5)) == 5
+    
+    def test_empty_gradient(self):
+        """Test a non-positive step count still yields an empty gradient."""
+        palette = get_palette()
+        
+        assert palette.get_gradient(0, 50, 0) == []
+        assert palette.get_gradient(0, 50, -3) == []
 
 
 class TestEmotionalContext:
@@ -113,6 +176,32 @@ class TestEmotionalContext:
         context.update("normal text")
         
         assert context.stress < 1.0  # Should decay
+    
+    def test_matcher_finds_all_groups_in_one_scan(self):
+        """Test the compiled matcher reports emotion and routing hits together."""
+        hits = INTENT_MATCHER.scan("Why is my CLOUD deploy still failed? HELP")
+        
+        assert hits["curiosity"] == {"why"}
+        assert hits["cloud"] == {"cloud", "deploy"}
+        assert hits["frustration"] == {"still", "failed"}
+        assert hits["stress"] == {"help"}
+        assert hits["finance"] == set()
+    
+    def test_matcher_keeps_substring_semantics(self):
+        """Test overlapping and prefix phrases are all reported."""
+        matcher = IndicatorMatcher({"a": ["deploy", "deployment"], "b": ["clouddeploy", "ploy"]})
+        
+        hits = matcher.scan("a clouddeployment")
+        
+        assert hits["a"] == {"deploy", "deployment"}
+        assert hits["b"] == {"clouddeploy", "ploy"}
+    
+    def test_update_reuses_precomputed_hits(self):
+        """Test update scores from a shared scan without rescanning."""
+        context = EmotionalContext()
+        context.update("unrelated text", hits=INTENT_MATCHER.scan("how and why"))
+        
+        assert context.curiosity == pytest.approx(0.7)
 
 
 class TestForesightEngine:
@@ -146,6 +235,119 @@ class TestForesightEngine:
         
         timelines = [p["timeline"] for p in predictions]
         assert len(set(timelines)) == len(timelines)  # All unique
+    
+    @pytest.mark.asyncio
+    async def test_prediction_cache_is_bounded(self):
+        """Test the prediction cache evicts least recently used contexts."""
+        foresight = ForesightEngine(cache=PredictionCache(max_size=3, ttl_seconds=None))
+        
+        for i in range(10):
+            await foresight.predict_next_actions({"intent": f"intent {i}"})
+        
+        stats = foresight.prediction_cache.stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 7
+        assert stats["misses"] == 10
+    
+    def test_prediction_cache_ttl_expiry(self):
+        """Test cached predictions expire after their TTL."""
+        now = [0.0]
+        cache = PredictionCache(max_size=10, ttl_seconds=5.0, clock=lambda: now[0])
+        cache.set("context", ["prediction"])
+        
+        assert cache.get("context") == ["prediction"]
+        now[0] = 6.0
+        assert cache.get("context") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_predictions_are_compact_records(self):
+        """Test predictions are slotted records that still read like dicts."""
+        foresight = ForesightEngine(depth=3)
+        prediction = (await foresight.predict_next_actions({"intent": "deploy"}))[1]
+        
+        assert isinstance(prediction, Prediction)
+        assert not hasattr(prediction, "__dict__")
+        assert prediction["step"] == 2 and prediction["timeline"] == "Ω-1"
+        assert prediction.to_dict() == {key: prediction[key] for key in prediction.keys()}
+        assert prediction.get("missing") is None
+        with pytest.raises(KeyError):
+            prediction["missing"]
+    
+    @pytest.mark.asyncio
+    async def test_prediction_strings_are_shared_across_contexts(self):
+        """Test repeated action strings are interned rather than copied."""
+        foresight = ForesightEngine(depth=5)
+        first = await foresight.predict_next_actions({"intent": "fix the error"})
+        second = await foresight.predict_next_actions({"intent": "another error"})
+        
+        assert all(a.action is b.action for a, b in zip(first, second))
+        assert all(a.timeline is b.timeline for a, b in zip(first, second))
+    
+    @pytest.mark.asyncio
+    async def test_deeper_requests_extend_the_cached_prefix(self):
+        """Test each step is computed once, whatever depths are requested."""
+        foresight = ForesightEngine(depth=20)
+        computed = []
+        original = foresight._predict_action
+        foresight._predict_action = lambda context, step: computed.append(step) or original(context, step)
+        context = {"intent": "deploy"}
+        
+        top = await foresight.predict_next_actions(context, steps=3)
+        deeper = await foresight.predict_next_actions(context, steps=10)
+        again = await foresight.predict_next_actions(context, steps=5)
+        full = await foresight.predict_next_actions(context)
+        
+        assert [len(top), len(deeper), len(again), len(full)] == [3, 10, 5, 20]
+        assert computed == list(range(20))
+        assert deeper[:3] == top and full[:10] == deeper
+        assert len(foresight.prediction_cache) == 1
+        assert await foresight.predict_next_actions(context, steps=50) == full
+    
+    @pytest.mark.asyncio
+    async def test_extending_a_prefix_keeps_its_ttl(self):
+        """Test deeper requests do not keep a cached prefix alive past its TTL."""
+        now = [0.0]
+        cache = PredictionCache(max_size=10, ttl_seconds=5.0, clock=lambda: now[0])
+        foresight = ForesightEngine(depth=20, cache=cache)
+        context = {"intent": "deploy"}
+        
+        await foresight.predict_next_actions(context, steps=3)
+        now[0] = 4.0
+        await foresight.predict_next_actions(context, steps=10)
+        now[0] = 6.0
+        await foresight.predict_next_actions(context, steps=3)
+        
+        assert cache.stats()["expirations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_manifest_computes_only_returned_predictions(self):
+        """Test manifest asks foresight for just the predictions it returns."""
+        omega = OmegaCore()
+        computed = []
+        original = omega.foresight._predict_action
+        omega.foresight._predict_action = lambda context, step: computed.append(step) or original(context, step)
+        
+        response = await omega.manifest("Tell me something interesting")
+        
+        assert len(response["predictions"]) == OmegaCore.RESPONSE_PREDICTIONS
+        assert computed == list(range(OmegaCore.RESPONSE_PREDICTIONS))
+    
+    def test_predictions_serialize_at_the_api_boundary(self):
+        """Test every JSON encoder renders predictions as plain objects."""
+        from api.server import JSON_ENCODERS
+        
+        prediction = Prediction(1, "run tests", 1.0, "Ω-0", "Loading models")
+        for name, encode in JSON_ENCODERS.items():
+            assert json.loads(encode([prediction])) == [prediction.to_dict()], name
+    
+    def test_omega_configures_prediction_cache(self):
+        """Test OmegaCore passes cache limits through to foresight."""
+        omega = OmegaCore(prediction_cache_size=8, prediction_cache_ttl=None)
+        
+        assert omega.foresight.prediction_cache.max_size == 8
+        assert omega.foresight.prediction_cache.ttl_seconds is None
 
 
 class TestEntropyGenerator:
@@ -172,6 +374,45 @@ class TestEntropyGenerator:
             insight = entropy.generate_unique_insight(f"context_{i}")
             assert insight not in insights
             insights.add(insight)
+    
+    @pytest.mark.parametrize("backend", ["exact", "digest", "bloom"])
+    def test_backends_stay_unique(self, backend):
+        """Test every uniqueness backend rejects repeats within its window."""
+        entropy = EntropyGenerator(backend=backend, window=500)
+        
+        insights = [entropy.generate_unique_insight("same") for _ in range(500)]
+        
+        assert len(set(insights)) == 500
+        stats = entropy.uniqueness_stats()
+        assert stats["backend"] == backend
+        assert stats["memory_bytes"] > 0
+        assert 0.0 <= stats["false_positive_rate"] < 1.0
+    
+    def test_digest_set_rotates_window(self):
+        """Test the digest backend keeps at most two windows of digests."""
+        digests = RotatingDigestSet(window=10)
+        for i in range(35):
+            digests.add(hashlib.sha256(str(i).encode()).digest())
+        
+        assert len(digests) <= 20
+        assert hashlib.sha256(b"34").digest() in digests
+        assert hashlib.sha256(b"0").digest() not in digests
+    
+    def test_bloom_filter_memory_is_fixed(self):
+        """Test Bloom filter memory does not grow with insertions."""
+        bloom = RotatingBloomFilter(window=1000, false_positive_rate=1e-4)
+        before = bloom.stats()["memory_bytes"]
+        for i in range(5000):
+            bloom.add(hashlib.sha256(str(i).encode()).digest())
+        
+        assert bloom.stats()["memory_bytes"] == before
+        assert hashlib.sha256(b"4999").digest() in bloom
+        assert bloom.stats()["false_positive_rate"] < 1e-3
+    
+    def test_unknown_backend_rejected(self):
+        """Test unknown uniqueness backends raise."""
+        with pytest.raises(ValueError):
+            EntropyGenerator(backend="abacus")
 
 
 class TestQuantumFinanceEngine:
@@ -207,6 +448,71 @@ class TestQuantumFinanceEngine:
         
         assert "timeline_arbitrage" in result
         assert "Timeline" in result["timeline_arbitrage"]
+    
+    def test_monte_carlo_runs_full_iterations(self):
+        """Test the simulation covers every requested path."""
+        finance = QuantumFinanceEngine(seed=7)
+        finance.BLOCK_SIZE = 4096
+        
+        paths = finance._quantum_monte_carlo("SPY", iterations=50000)
+        
+        assert len(paths) == 50000
+        assert len(paths.returns) == finance.top_k
+        assert np.all(np.diff(paths.probabilities) <= 0)
+        assert list(paths.timelines[:3]) == [0, 1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_seeded_analysis_is_reproducible(self):
+        """Test the same seed yields the same market analysis."""
+        first = await QuantumFinanceEngine(seed=42).analyze_market("AAPL")
+        second = await QuantumFinanceEngine(seed=42).analyze_market("AAPL")
+        
+        assert first == second
+        json.dumps(first)  # Plain floats only, no NumPy scalars
+    
+    @pytest.mark.asyncio
+    async def test_sharded_analysis_matches_any_worker_count(self):
+        """Test sharded runs give identical results for inline, 1 or 3 workers."""
+        results = []
+        for workers, inline_paths in ((1, 240000), (1, 0), (3, 0)):
+            finance = QuantumFinanceEngine(
+                seed=11, iterations=240000, max_workers=workers, parallel_threshold=0
+            )
+            finance.BLOCK_SIZE = 50000
+            finance.INLINE_PATHS = inline_paths
+            try:
+                results.append(await finance.analyze_market("NVDA"))
+            finally:
+                finance.close()
+        
+        assert results[0] == results[1] == results[2]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_many_streams_in_order(self):
+        """Test batch analysis yields one result per symbol in input order."""
+        finance = QuantumFinanceEngine(seed=3, iterations=20000)
+        finance.BLOCK_SIZE = 60000  # Three symbols per vectorized chunk
+        symbols = [f"SYM{i}" for i in range(10)]
+        
+        results = [result async for result in finance.analyze_many(symbols)]
+        
+        assert [r["symbol"] for r in results] == symbols
+        assert all(len(r["probable_paths"]) == 5 for r in results)
+        assert len({r["timeline_arbitrage"] for r in results}) == len(symbols)
+    
+    @pytest.mark.asyncio
+    async def test_zero_iterations_give_empty_analysis(self):
+        """Test an empty run still composes an analysis instead of crashing."""
+        finance = QuantumFinanceEngine(seed=5, iterations=0)
+        
+        result = await finance.analyze_market("VOID")
+        batch = [r async for r in finance.analyze_many(["VOID", "NULL"])]
+        
+        assert result["probable_paths"] == []
+        assert result["optimal_action"].startswith("HOLD")
+        assert len(finance._quantum_monte_carlo("VOID", iterations=0)) == 0
+        assert [r["symbol"] for r in batch] == ["VOID", "NULL"]
+        json.dumps(result)
 
 
 class TestCloudOrchestrator:
@@ -302,6 +608,105 @@ class TestOmegaCore:
         assert response["response_type"] == "finance"
         assert "symbol" in response["manifestation"]
     
+    @pytest.mark.asyncio
+    async def test_router_counts_hits_per_route(self):
+        """Test routing picks one handler per request and counts it."""
+        omega = OmegaCore()
+        
+        await omega.manifest("Deploy to the cloud")
+        await omega.manifest("Trade some shares")
+        await omega.manifest("Tell me a story")
+        
+        assert omega.router.stats() == {"cloud": 1, "finance": 1, "general": 1}
+    
+    @pytest.mark.asyncio
+    async def test_router_accepts_runtime_routes(self):
+        """Test routes registered at runtime are matched by the shared scan."""
+        omega = OmegaCore()
+        
+        async def handle_security(core, intent):
+            return {"audit": intent}
+        
+        omega.router.register("security", ["vulnerability", "cve"], handle_security)
+        response = await omega.manifest("Is there a CVE in my deploy?")
+        assert response["response_type"] == "infrastructure"  # Earlier routes win
+        
+        response = await omega.manifest("Scan for a vulnerability please, I'm stuck")
+        assert response["response_type"] == "security"
+        assert response["manifestation"] == {"audit": "Scan for a vulnerability please, I'm stuck"}
+        assert omega.router.stats()["security"] == 1
+        
+        with pytest.raises(ValueError):
+            omega.router.register("stress", ["panic"], handle_security)
+    
+    @pytest.mark.asyncio
+    async def test_manifest_many_preserves_order(self):
+        """Test batched manifest groups by route but answers in input order."""
+        omega = OmegaCore()
+        intents = ["Deploy my API", "Trade TSLA", "Say hello", "Invest in TSLA", "Scale it"]
+        
+        responses = await omega.manifest_many(intents)
+        
+        assert [r["response_type"] for r in responses] == [
+            "infrastructure", "finance", "general", "finance", "infrastructure"
+        ]
+        assert responses[1]["manifestation"]["symbol"] == "TSLA"
+        assert len({r["unique_insight"] for r in responses}) == len(intents)
+        assert omega.router.stats() == {"cloud": 2, "finance": 2, "general": 1}
+    
+    @pytest.mark.asyncio
+    async def test_manifest_many_runs_batch_handler_once(self):
+        """Test a route's batch handler is invoked once per group."""
+        omega = OmegaCore()
+        calls = []
+        
+        async def handle_single(core, intent):
+            return {"single": intent}
+        
+        async def handle_batch(core, intents):
+            calls.append(list(intents))
+            return [{"batched": intent} for intent in intents]
+        
+        omega.router.register("weather", ["rain", "sun"], handle_single, batch_handler=handle_batch)
+        responses = await omega.manifest_many(["rain today", "hello", "sun tomorrow"])
+        
+        assert calls == [["rain today", "sun tomorrow"]]
+        assert responses[2]["manifestation"] == {"batched": "sun tomorrow"}
+    
+    @pytest.mark.asyncio
+    async def test_manifest_stream_sections(self):
+        """Test streaming manifest yields every section, manifestation last."""
+        omega = OmegaCore()
+        
+        sections = [section async for section in omega.manifest_stream("Analyze TSLA market")]
+        names = [name for name, _ in sections]
+        
+        assert names == [
+            "session", "emotional_state", "spectral_signature",
+            "predictions", "unique_insight", "manifestation", "complete"
+        ]
+        assert sections[0][1]["response_type"] == "finance"
+        assert sections[5][1]["symbol"] == "TSLA"
+    
+    @pytest.mark.asyncio
+    async def test_manifest_stream_sends_header_before_slow_handler(self):
+        """Test the first section arrives before a slow handler finishes."""
+        omega = OmegaCore()
+        finished = asyncio.Event()
+        
+        async def slow_handler(core, intent):
+            await asyncio.sleep(0.05)
+            finished.set()
+            return {"done": True}
+        
+        omega.router.register("slow", ["glacier"], slow_handler)
+        stream = omega.manifest_stream("glacier please")
+        
+        name, payload = await stream.__anext__()
+        assert name == "session" and not finished.is_set()
+        rest = [section async for section in stream]
+        assert rest[-2] == ("manifestation", {"done": True})
+    
     def test_mode_switching(self):
         """Test consciousness mode switching."""
         omega = OmegaCore()
@@ -334,6 +739,577 @@ class TestOmegaCore:
         assert response["processing_time_ms"] < 1000  # Should be fast
 
 
+class TestSessionPool:
+    """Test per-session consciousness states."""
+    
+    def test_sessions_share_engines_not_state(self):
+        """Test sessions share heavy engines but keep their own emotions."""
+        pool = SessionPool(OmegaCore())
+        first = pool.get("alpha")
+        second = pool.get("beta")
+        
+        first.emotional_context.stress = 0.9
+        first.set_mode("quantum")
+        
+        assert second.emotional_context.stress == 0.0
+        assert second.consciousness == ConsciousnessLevel.OMEGA
+        assert first.finance is second.finance
+        assert first.router is second.router
+        assert first.palette is second.palette
+        assert pool.get("alpha") is first
+    
+    def test_lru_eviction_and_idle_ttl(self):
+        """Test the pool evicts least recently used and idle sessions."""
+        now = [0.0]
+        pool = SessionPool(OmegaCore(), max_sessions=2, idle_ttl_seconds=60.0, clock=lambda: now[0])
+        
+        pool.get("a")
+        pool.get("b")
+        pool.get("a")
+        pool.get("c")  # Evicts "b", the least recently used
+        assert pool.peek("b") is None
+        assert pool.peek("a") is not None
+        
+        now[0] = 120.0
+        assert pool.peek("a") is None  # Idle past the TTL, even before it is purged
+        pool.get("d")
+        assert pool.peek("a") is None and pool.peek("c") is None
+        assert pool.stats()["evictions"] == 1
+        assert pool.stats()["expirations"] == 2
+    
+    def test_generated_session_ids(self):
+        """Test sessions without an id get a fresh one."""
+        pool = SessionPool(OmegaCore())
+        
+        session = pool.get()
+        
+        assert session.session_id.startswith("omega-")
+        assert pool.peek(session.session_id) is session
+    
+    def test_anonymous_requests_do_not_fill_the_pool(self):
+        """Test requests without a session id use the global core, not the pool."""
+        from fastapi.testclient import TestClient
+        from api.server import app, omega, sessions
+        
+        client = TestClient(app)
+        before = len(sessions)
+        
+        mode = omega.consciousness
+        ids = set()
+        body = {"intent": "Tell me something", "consciousness_level": "quantum"}
+        for _ in range(5):
+            response = client.post("/api/v1/manifest", json=body)
+            ids.add(response.json()["session_id"])
+        response = client.post("/api/v1/manifest/batch", json={"intents": ["one", "two"]})
+        ids.add(response.json()["session_id"])
+        
+        # Each anonymous request gets its own ephemeral session; the global core is untouched
+        assert len(sessions) == before
+        assert len(ids) == 6 and omega.session_id not in ids
+        assert omega.consciousness == mode
+        
+        client.post("/api/v1/manifest", json={"intent": "Hello", "session_id": "pooled-session"})
+        assert len(sessions) == before + 1
+
+
+class TestLatencyHistogram:
+    """Test latency histograms and SLO checks."""
+    
+    def test_percentiles_within_bucket_error(self):
+        """Test reported percentiles stay within one bucket of the truth."""
+        rng = np.random.default_rng(7)
+        samples = rng.lognormal(1.0, 1.0, 50000)
+        histogram = LatencyHistogram()
+        for ms in samples:
+            histogram.record(float(ms))
+        
+        growth = 2 ** (1 / LatencyHistogram.BUCKETS_PER_DOUBLING)
+        for q in (50, 90, 99):
+            exact = float(np.percentile(samples, q))
+            assert exact / growth <= histogram.percentile(q) <= exact * growth
+        assert histogram.count == 50000
+        assert histogram.percentile(100) == pytest.approx(samples.max())
+    
+    def test_slo_check(self):
+        """Test SLO checks compare p50 and p99 against their targets."""
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.record(5.0)
+        histogram.record(80.0)
+        histogram.record(90.0)
+        
+        slo = histogram.check_slo(p50_ms=20, p99_ms=50)
+        assert slo["p50_ok"] is True
+        assert slo["p99_ok"] is False
+        assert slo["count"] == 100
+    
+    @pytest.mark.asyncio
+    async def test_manifest_records_latency_by_response_type(self):
+        """Test manifest feeds a histogram per response type, shared by sessions."""
+        omega = OmegaCore()
+        session = omega.fork_session()
+        
+        await omega.manifest("Deploy to the cloud")
+        await session.manifest("Analyze the TSLA market")
+        await session.manifest("Analyze the AAPL market")
+        
+        assert omega.latency["infrastructure"].count == 1
+        assert omega.latency["finance"].count == 2
+    
+    def test_metrics_endpoint(self):
+        """Test /metrics exposes histograms, counters and SLO checks."""
+        from fastapi.testclient import TestClient
+        from api.server import app
+        
+        client = TestClient(app)
+        client.post("/api/v1/manifest", json={"intent": "Deploy to the cloud"})
+        body = client.get("/metrics").text
+        
+        assert 'cloudpoof_request_duration_seconds_count{method="POST",route="/api/v1/manifest"}' in body
+        assert 'cloudpoof_manifest_duration_seconds_bucket{response_type="infrastructure",le="+Inf"}' in body
+        assert "cloudpoof_prediction_cache_hits_total" in body
+        assert "cloudpoof_entropy_regenerations_total" in body
+        assert "cloudpoof_stream_subscribers 0" in body
+        assert 'cloudpoof_slo_target_seconds{quantile="0.99"} 0.05' in body
+
+
+class TestTracing:
+    """Test per-stage manifest tracing."""
+    
+    STAGES = ["scan", "emotional_update", "predict", "insight", "handler", "gradient"]
+    
+    @pytest.mark.asyncio
+    async def test_manifest_records_every_stage(self):
+        """Test every manifest feeds the tracer's per-stage histograms."""
+        omega = OmegaCore()
+        response = await omega.manifest("Deploy to the cloud")
+        await omega.manifest("Analyze the TSLA market")
+        
+        assert "timings_ms" not in response
+        assert list(omega.tracer.stage_latency) == self.STAGES
+        assert all(h.count == 2 for h in omega.tracer.stage_latency.values())
+    
+    @pytest.mark.asyncio
+    async def test_timings_returned_on_request(self):
+        """Test include_timings returns stage durations that fit in the total."""
+        omega = OmegaCore()
+        response = await omega.manifest("Deploy to the cloud", include_timings=True)
+        timings = response["timings_ms"]
+        
+        assert list(timings) == self.STAGES + ["total"]
+        assert sum(timings[stage] for stage in self.STAGES) <= timings["total"]
+    
+    @pytest.mark.asyncio
+    async def test_otlp_export_hook(self):
+        """Test the exporter receives OTLP/JSON with stages as child spans."""
+        exported = []
+        omega = OmegaCore(tracer=Tracer(exporter=exported.append))
+        await omega.manifest("Deploy to the cloud")
+        
+        spans = exported[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, children = spans[0], spans[1:]
+        assert root["name"] == "manifest" and root["parentSpanId"] == ""
+        assert [span["name"] for span in children] == [f"manifest.{stage}" for stage in self.STAGES]
+        assert all(span["traceId"] == root["traceId"] for span in children)
+        assert all(span["parentSpanId"] == root["spanId"] for span in children)
+        assert all(int(span["startTimeUnixNano"]) <= int(span["endTimeUnixNano"]) for span in spans)
+    
+    @pytest.mark.asyncio
+    async def test_manifest_many_is_traced_and_timed(self):
+        """Test a batch records one trace and a latency sample per intent."""
+        exported = []
+        omega = OmegaCore(tracer=Tracer(exporter=exported.append))
+        await omega.manifest_many(["Deploy my API", "Trade TSLA", "Invest in AAPL"])
+        
+        assert omega.latency["infrastructure"].count == 1
+        assert omega.latency["finance"].count == 2
+        assert list(omega.tracer.stage_latency) == [
+            "batch_route", "batch_predict", "batch_insight", "batch_handler"
+        ]
+        root = exported[0]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert len(exported) == 1 and root["name"] == "manifest_batch"
+        assert {"key": "batch_size", "value": {"stringValue": "3"}} in root["attributes"]
+    
+    @pytest.mark.asyncio
+    async def test_exporter_errors_do_not_fail_requests(self):
+        """Test a failing exporter is counted rather than raised."""
+        def broken(payload):
+            raise ConnectionError("collector down")
+        
+        omega = OmegaCore(tracer=Tracer(exporter=broken))
+        response = await omega.manifest("Hello there")
+        
+        assert response["response_type"] == "general"
+        assert omega.tracer.export_errors == 1
+    
+    def test_debug_header_returns_timings(self):
+        """Test the debug header opts in to timings and a Server-Timing header."""
+        from fastapi.testclient import TestClient
+        from api.server import app
+        
+        client = TestClient(app)
+        plain = client.post("/api/v1/manifest", json={"intent": "Deploy to the cloud"})
+        debug = client.post(
+            "/api/v1/manifest",
+            json={"intent": "Deploy to the cloud"},
+            headers={"X-CloudPoof-Debug": "timings"}
+        )
+        
+        assert "timings_ms" not in plain.json() and "server-timing" not in plain.headers
+        assert "predict" in debug.json()["timings_ms"]
+        assert "handler;dur=" in debug.headers["server-timing"]
+
+
+class TestProfiler:
+    """Test the sampling profiler and its admin gate."""
+    
+    def test_sampler_sees_other_threads(self):
+        """Test samples include a busy worker thread's stack, root first."""
+        import threading
+        from api.profiler import StackSampler, collapse
+        
+        stop = threading.Event()
+        
+        def spin_for_profiler():
+            while not stop.is_set():
+                sum(range(1000))
+        
+        worker = threading.Thread(target=spin_for_profiler, name="busy-worker")
+        worker.start()
+        try:
+            sampler = StackSampler(interval=0.002)
+            stacks = sampler.run(0.2)
+        finally:
+            stop.set()
+            worker.join()
+        
+        assert sampler.samples > 10
+        busy = [stack for stack in stacks if stack.startswith("busy-worker;")]
+        assert busy and all("spin_for_profiler" in stack for stack in busy)
+        line = collapse(stacks).splitlines()[0]
+        assert int(line.rsplit(" ", 1)[1]) == stacks.most_common(1)[0][1]
+    
+    def test_profile_endpoint_is_admin_gated(self, monkeypatch):
+        """Test the endpoint hides without a token and checks the one sent."""
+        from fastapi.testclient import TestClient
+        from api.server import app
+        
+        client = TestClient(app)
+        monkeypatch.delenv("CLOUDPOOF_PROFILER_TOKEN", raising=False)
+        assert client.get("/admin/profile?seconds=0.05").status_code == 404
+        
+        monkeypatch.setenv("CLOUDPOOF_PROFILER_TOKEN", "s3cret")
+        assert client.get("/admin/profile?seconds=0.05").status_code == 403
+        assert client.get(
+            "/admin/profile?seconds=0.05", headers={"X-CloudPoof-Admin-Token": "wrong"}
+        ).status_code == 403
+        assert client.get(
+            "/admin/profile?seconds=0.05", headers={"X-CloudPoof-Admin-Token": "s3crét".encode("latin-1")}
+        ).status_code == 403
+        
+        response = client.get(
+            "/admin/profile?seconds=0.05&interval_ms=5", headers={"X-CloudPoof-Admin-Token": "s3cret"}
+        )
+        assert response.status_code == 200
+        assert int(response.headers["X-CloudPoof-Samples"]) > 0
+        assert any(line.startswith("event-loop;") for line in response.text.splitlines())
+
+
+class TestBenchRunner:
+    """Test the benchmark runner's statistics and regression check."""
+    
+    def test_confidence_interval(self):
+        """Test the 95% interval uses Student's t for small samples."""
+        from cloudpoof_tools.bench import BenchmarkStats
+        
+        stats = BenchmarkStats.from_samples("op", "core", 100, [10.0, 12.0, 11.0, 13.0, 9.0])
+        margin = 2.776 * stats.stdev_us / 5 ** 0.5
+        assert stats.mean_us == pytest.approx(11.0)
+        assert stats.ci_low_us == pytest.approx(11.0 - margin)
+        assert stats.ci_high_us == pytest.approx(11.0 + margin)
+    
+    @pytest.mark.asyncio
+    async def test_runner_calibrates_trials(self):
+        """Test each trial runs enough ops to meet the minimum trial time."""
+        from cloudpoof_tools.bench import Benchmark, BenchmarkRunner
+        
+        calls = []
+        
+        async def op():
+            calls.append(1)
+        
+        runner = BenchmarkRunner(warmup_trials=1, trials=3, min_trial_seconds=0.002)
+        stats = await runner.run_one(Benchmark("noop", op))
+        
+        assert stats.trials == 3
+        assert stats.ops_per_trial > 1
+        assert len(calls) >= stats.ops_per_trial * 4
+        assert stats.ci_low_us <= stats.mean_us <= stats.ci_high_us
+    
+    def test_regressions_need_the_whole_interval_past_threshold(self):
+        """Test only benchmarks clearly slower than the baseline are flagged."""
+        from cloudpoof_tools.bench import BenchmarkStats, find_regressions
+        
+        baseline = {"results": {
+            "steady": {"mean_us": 10.0},
+            "noisy": {"mean_us": 10.0},
+            "slower": {"mean_us": 10.0}
+        }}
+        results = [
+            BenchmarkStats.from_samples("steady", "core", 1, [10.1, 9.9, 10.0]),
+            BenchmarkStats.from_samples("noisy", "core", 1, [8.0, 16.0, 12.0]),
+            BenchmarkStats.from_samples("slower", "core", 1, [13.0, 13.1, 12.9]),
+            BenchmarkStats.from_samples("new", "core", 1, [50.0, 50.0, 50.0])
+        ]
+        
+        assert [r["name"] for r in find_regressions(results, baseline, threshold=0.10)] == ["slower"]
+
+
+class TestLoadGenerator:
+    """Test the open-loop load generator."""
+    
+    @pytest.mark.asyncio
+    async def test_arrivals_keep_schedule_during_a_stall(self):
+        """Test arrivals continue through a stall and are timed from schedule."""
+        from cloudpoof_tools.loadgen import OpenLoopGenerator
+        
+        lock = asyncio.Lock()
+        calls = [0]
+        
+        async def serialized_server():
+            async with lock:
+                calls[0] += 1
+                # One request stalls the "server" for 200ms
+                await asyncio.sleep(0.2 if calls[0] == 10 else 0.001)
+        
+        result = await OpenLoopGenerator(serialized_server, rate=200, duration=0.5).run()
+        
+        assert result.sent == result.completed == 100
+        # Arrivals queued behind the stall are all slow, not just the stalled one
+        slow = result.latency.count - result.latency.cumulative(8 * 16)  # > 65.5ms
+        assert slow >= 10
+        assert result.latency.percentile(50) >= result.service.percentile(50)
+    
+    @pytest.mark.asyncio
+    async def test_sweep_finds_max_sustainable_rate(self):
+        """Test the sweep brackets and bisects to the sustainable limit."""
+        from cloudpoof_tools.loadgen import LoadResult, find_max_throughput
+        
+        async def synthetic(rate):
+            result = LoadResult("synthetic", rate, 1.0, sent=100, completed=100, elapsed=100 / rate)
+            for _ in range(100):
+                result.latency.record(10.0 if rate <= 300 else 500.0)
+            return result
+        
+        best, results = await find_max_throughput(synthetic, p99_target_ms=50, start_rate=50, refine_steps=5)
+        
+        assert [r.offered_rate for r in results[:4]] == [50, 100, 200, 400]
+        assert 290 <= best <= 300
+
+
+class TestConsciousnessBroadcaster:
+    """Test the shared consciousness stream fan-out."""
+    
+    @pytest.mark.asyncio
+    async def test_publishes_once_per_change(self):
+        """Test every subscriber gets the same snapshot, only on change."""
+        from api.server import ConsciousnessBroadcaster
+        
+        core = OmegaCore()
+        broadcaster = ConsciousnessBroadcaster(core, interval=3600)
+        first = broadcaster.subscribe()
+        second = broadcaster.subscribe()
+        
+        assert broadcaster.publish_if_changed()
+        assert not broadcaster.publish_if_changed()
+        core.set_mode("quantum")
+        assert broadcaster.publish_if_changed()
+        
+        assert first.qsize() == second.qsize() == 2
+        assert first.get_nowait() is second.get_nowait()
+        assert broadcaster.published == 2
+        
+        broadcaster.unsubscribe(first)
+        broadcaster.unsubscribe(second)
+        assert broadcaster.subscriber_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_newest(self):
+        """Test a full queue drops its oldest snapshot instead of blocking."""
+        from api.server import ConsciousnessBroadcaster
+        
+        core = OmegaCore()
+        broadcaster = ConsciousnessBroadcaster(core, interval=3600, queue_size=2)
+        queue = broadcaster.subscribe()
+        
+        for timeline in ("a", "b", "c", "d"):
+            core.timeline = timeline
+            broadcaster.publish_if_changed()
+        
+        assert [queue.get_nowait()["timeline"] for _ in range(queue.qsize())] == ["c", "d"]
+        assert broadcaster.dropped == 2
+        broadcaster.unsubscribe(queue)
+
+
+class TestCLI:
+    """Test the command line interface stays quick to start."""
+    
+    def test_quick_commands_skip_heavy_imports(self):
+        """Test version and config run without importing the core or NumPy."""
+        import os
+        import subprocess
+        import sys
+        
+        script = (
+            "import sys, cli\n"
+            "for args in (['version'], ['config', '-f', 'env']):\n"
+            "    cli.cli(args, standalone_mode=False)\n"
+            "print(sorted(m for m in ('cloudpoof_core', 'numpy', 'asyncio') if m in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        completed = subprocess.run(
+            [sys.executable, "-c", script], cwd=root, capture_output=True, text=True, check=True
+        )
+        
+        assert completed.stdout.strip().splitlines()[-1] == "[]"
+    
+    @pytest.mark.skipif(
+        not os.environ.get("CLOUDPOOF_BENCHMARKS"),
+        reason="wall-clock benchmark; set CLOUDPOOF_BENCHMARKS=1 to run"
+    )
+    def test_cold_import_within_budget(self):
+        """Test `import cli` stays within its import-time budget."""
+        import statistics
+        from test_evaluation_benchmarks import ImportTimeBenchmarks
+        
+        for module, budget_ms in ImportTimeBenchmarks.IMPORT_BUDGETS_MS.items():
+            runs = [ImportTimeBenchmarks.measure_import(module)[module] for _ in range(3)]
+            median_ms = statistics.median(runs)
+            
+            assert median_ms <= budget_ms * ImportTimeBenchmarks.BUDGET_SLACK, (
+                f"import {module} took {median_ms:.1f} ms (budget {budget_ms:.0f} ms)"
+            )
+    
+    def test_version_matches_core(self):
+        """Test the CLI reads its version from the same place as the core."""
+        import cli
+        import cloudpoof_core
+        
+        assert cli.__version__ == cloudpoof_core.__version__
+        assert cli.__author__ == cloudpoof_core.__author__
+
+
+class TestStartup:
+    """Test the main entry point's initialization pipeline."""
+    
+    @pytest.mark.asyncio
+    async def test_headless_initialization_reports_real_timings(self):
+        """Test warm-ups run without cosmetic delays and report elapsed times."""
+        import time
+        import main
+        
+        start = time.perf_counter()
+        omega, timings = await main.initialize_components("quantum", headless=True)
+        elapsed = time.perf_counter() - start
+        
+        assert omega.consciousness == ConsciousnessLevel.QUANTUM
+        assert [name for name, _ in timings][0] == "Quantum Substrate"
+        assert len(timings) == len(main.warmup_components(omega)) + 1
+        assert all(ms >= 0 for _, ms in timings)
+        assert elapsed < 2.1  # The old pipeline slept 2.1s on its own
+    
+    @pytest.mark.asyncio
+    async def test_finance_warmup_runs_off_the_event_loop(self):
+        """Test the Monte Carlo warm-up doesn't block the loop's thread."""
+        import threading
+        import main
+        
+        omega = OmegaCore()
+        threads = []
+        analyze = omega.finance.analyze_market_sync
+        omega.finance.analyze_market_sync = lambda symbol: threads.append(threading.get_ident()) or analyze(symbol)
+        
+        warmups = {name: warmup for name, _, warmup in main.warmup_components(omega)}
+        await warmups["Synthesis Core"]()
+        
+        assert threads and threads[0] != threading.get_ident()
+    
+    @pytest.mark.asyncio
+    async def test_server_mode_warms_the_served_core(self):
+        """Test server mode warms api.server's own core rather than a spare one."""
+        import main
+        from api import server
+        
+        omega, timings = await main.initialize_components("omega", server=True, headless=True)
+        
+        assert omega is server.omega
+        assert timings[0][0] == "Transcendence Interface"
+
+
+class TestPreforkServer:
+    """Test the pre-fork server's shared worker metrics."""
+    
+    def test_metrics_aggregate_across_forked_workers(self):
+        """Test rows written by forked workers are visible to the master."""
+        import os
+        from api.prefork import SharedMetrics
+        
+        metrics = SharedMetrics(slots=4)
+        try:
+            pids = []
+            for slot in (0, 1):
+                metrics.claim(slot)
+                pid = os.fork()
+                if pid == 0:
+                    for _ in range(slot + 2):
+                        metrics.request_started(slot)
+                        metrics.request_finished(slot, 0.002, error=slot == 1)
+                    os._exit(0)
+                metrics.assign(slot, pid)
+                pids.append(pid)
+            for pid in pids:
+                os.waitpid(pid, 0)
+            
+            snapshot = metrics.snapshot()
+            assert snapshot["workers"] == 2
+            assert snapshot["requests"] == 5
+            assert snapshot["errors"] == 3
+            assert snapshot["active"] == 0
+            assert snapshot["mean_latency_ms"] == pytest.approx(2.0)
+            
+            # Counters outlive the worker that produced them, reported as retired
+            metrics.release(0)
+            snapshot = metrics.snapshot()
+            assert snapshot["workers"] == 1
+            assert snapshot["requests"] == 5
+            assert snapshot["retired"] == {"requests": 2, "errors": 0}
+            assert snapshot["live"] == {"requests": 3, "errors": 3}
+            assert sum(w["requests"] for w in snapshot["per_worker"]) == snapshot["live"]["requests"]
+            
+            # The slot's next worker starts from zero, not ready
+            metrics.mark_ready(0)
+            metrics.claim(0)
+            metrics.assign(0, os.getpid())
+            assert not metrics.is_ready(0)
+            assert metrics.snapshot()["per_worker"][0]["requests"] == 0
+            assert metrics.snapshot()["requests"] == 5
+        finally:
+            metrics.close(unlink=True)
+    
+    def test_new_workers_only_get_free_slots(self):
+        """Test a reload's workers never share metrics rows with serving or draining ones."""
+        from api.prefork import PreforkServer
+        
+        server = PreforkServer(workers=2)
+        server._children = {101: 2, 102: 3}
+        server._retiring = {99: 0}
+        assert server._free_slots() == [1]
+        
+        # A draining worker's slot frees up only once it has been reaped
+        server._retiring = {}
+        assert server._free_slots() == [0, 1]
+
+
 class TestPerformance:
     """Performance and benchmark tests."""
     